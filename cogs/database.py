@@ -1,24 +1,42 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from typing import Optional
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sqlite3
 import asyncio
-from datetime import datetime, timedelta
+import threading
+from time import monotonic
+from pathlib import Path
+from datetime import date as Date  # aliased: commands take a 'date' string argument
 
 class DiscordLogHandler(logging.Handler):
     """Custom logging handler that sends terminal logs to Discord"""
     
+    # Library loggers whose INFO chatter (gateway connects, resumes...) isn't worth a Discord message;
+    # their warnings and errors are still forwarded
+    LIBRARY_LOGGERS = ("discord.", "asyncio", "aiohttp.")
+    
     def __init__(self, database_cog):
         super().__init__()
         self.database_cog = database_cog
         self.setLevel(logging.INFO)  # Capture INFO and above
+        self.addFilter(self._skip_library_info)
         
         formatter = logging.Formatter('%(levelname)s: %(message)s')
         self.setFormatter(formatter)
     
+    def _skip_library_info(self, record) -> bool:
+        """Filter out library records below WARNING; runs before the record is formatted."""
+        return record.levelno >= logging.WARNING or not record.name.startswith(self.LIBRARY_LOGGERS)
+    
     def emit(self, record):
         """Called whenever a log message is generated"""
+        if not self.database_cog.log_channel_id:
+            return  # logging to Discord is off - skip formatting entirely
         try:
             log_message = self.format(record)
             
@@ -32,32 +50,91 @@ class DiscordLogHandler(logging.Handler):
             
             formatted_message = f"{emoji} `{log_message}`"
             
-            if self.database_cog.log_channel_id:
-                try:
-                    self.database_cog.log_queue.put_nowait(formatted_message)
-                except asyncio.QueueFull:
-                    pass
+            # Runs on the QueueListener thread - hand the message to the event loop
+            self.database_cog.bot.loop.call_soon_threadsafe(self._enqueue, formatted_message)
         except Exception:
             pass  
 
+    def _enqueue(self, message):
+        """Put a formatted message on the log queue, dropping it if the queue is full."""
+        try:
+            self.database_cog.log_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            pass
+
 class DatabaseCog(commands.Cog):
     """
     Cog to manage database connections and operations.
     """
     MAXIMUM_LOG_QUEUE = 100
-    LOG_PROCESSOR_TIMEOUT = 5.0  # seconds to wait for new log messages
-    LOG_SEND_DELAY = 1.0         # seconds between Discord messages to avoid rate limits
+    LOG_SEND_DELAY = 1.0         # minimum seconds between Discord messages to avoid rate limits
+    LOG_BATCH_SIZE = 20          # queued log lines folded into one Discord message
+    LOG_BATCH_CHARS = 1900       # stay under Discord's 2000 character message limit
     LOG_ERROR_RETRY_DELAY = 5.0  # seconds to wait after log processor errors
+    MAINTENANCE_INTERVAL = 15    # minutes between WAL checkpoints / planner refreshes
+    DB_GUILDS_LIMIT = 10         # servers listed by db_guilds (embeds hold at most 25 fields)
+    # Column headings and separator for the recent_scores table, built once
+    RECENT_SCORES_COLUMNS = (
+        "=" * 60 + "\n"
+        + f"{'Username':<15} {'Score':<5} {'Date':<12} {'Guild':<10}\n"
+        + "-" * 60 + "\n"
+    )
+    
+    # Hot-path statements kept as single shared strings so sqlite3's statement cache always hits
+    DELETE_GUILD_SCORES_QUERY = "DELETE FROM wordle_scores WHERE guild_id = ?"
+    USER_IDS_FOR_DATE_QUERY = "SELECT user_id FROM wordle_scores WHERE guild_id = ? AND date = ?"
+    # Upsert on the (user_id, guild_id, date) unique index: updates in place instead of
+    # INSERT OR REPLACE's delete + reinsert, which churned row ids and index entries
+    UPSERT_SCORE_QUERY = """INSERT INTO wordle_scores 
+                   (user_id, guild_id, username, score, date) 
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (user_id, guild_id, date) DO UPDATE SET
+                       username = excluded.username,
+                       score = excluded.score,
+                       timestamp = CURRENT_TIMESTAMP"""
+    # Insert-if-new: a score already on record for that user, guild and day is left untouched
+    INSERT_IF_NEW_QUERY = """INSERT INTO wordle_scores 
+                   (user_id, guild_id, username, score, date) 
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (user_id, guild_id, date) DO NOTHING"""
+    STATEMENT_CACHE_SIZE = 256  # prepared statements kept per connection (sqlite3 default is 128)
+    READ_POOL_SIZE = 3          # read-only connections, so concurrent reads don't queue on each other
+    SCHEMA_VERSION = 2          # PRAGMA user_version; 1 = INTEGER user_id/guild_id, 2 = one score per user per day
+    
+    # Applied once to the long-lived connection: WAL lets reads run alongside writes,
+    # and NORMAL sync skips the per-commit fsync that WAL makes unnecessary
+    CONNECTION_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-20000",    # negative = KiB, so ~20 MB of page cache
+        "PRAGMA mmap_size=134217728",  # read pages straight from a 128 MB memory map
+        "PRAGMA busy_timeout=5000",    # ms to wait on a lock held by another process (e.g. a backup or sqlite3 shell)
+    )
+    # The read-only connection can't change the journal mode or sync level, only its own caches and timeout
+    READ_CONNECTION_PRAGMAS = CONNECTION_PRAGMAS[2:]
     
     def __init__(self, bot: commands.Bot) -> None:
         """Initialize the DatabaseCog with bot instance."""
         self.bot = bot
-        self.database_path = 'wordle_scores.db'
+        # DATABASE_PATH lets the file live elsewhere, e.g. on tmpfs with backups taken separately
+        self.database_path = os.getenv("DATABASE_PATH", 'wordle_scores.db')
         self.connection = None
+        # Serializes access to the shared connection; queries may run in worker threads
+        self.lock = threading.RLock()
+        # Read-only connections for SELECTs, so reads never wait behind a write (or each other).
+        # Idle ones sit in the thread-safe pool; worker threads take one per query
+        self.read_connections = []
+        self.read_pool = queue.SimpleQueue()
+        # Guards checking a connection out of the pool against the pool being closed
+        self.read_pool_lock = threading.Lock()
         
         self.log_queue = asyncio.Queue(maxsize=self.MAXIMUM_LOG_QUEUE)
         self.log_channel_id = None
         self.discord_handler = DiscordLogHandler(self)
+        # Root logger only enqueues records; a background thread feeds them to discord_handler
+        self.log_queue_handler = None
+        self.log_listener = None
         self.log_processor_task = None
         
         # Start log processor (only if bot has a loop - not in tests)
@@ -69,9 +146,19 @@ class DatabaseCog(commands.Cog):
     def connect_to_database(self) -> None:
         """Establish a connection to the SQLite database."""
         try:
-            self.connection = sqlite3.connect(self.database_path)
+            self.connection = sqlite3.connect(
+                self.database_path, check_same_thread=False, cached_statements=self.STATEMENT_CACHE_SIZE
+            )
+            for pragma in self.CONNECTION_PRAGMAS:
+                self.connection.execute(pragma)
+            journal_mode = self.connection.execute("PRAGMA journal_mode").fetchone()[0]
+            if journal_mode != "wal" and self.database_path != ":memory:":  # in-memory databases can't use WAL
+                logging.warning(f"Database is in {journal_mode} journal mode, not WAL; reads will block on writes")
+            # The connection lives for the whole process; make sure it is closed cleanly on exit
+            atexit.register(self.close_connection)
             logging.info(f"Connected to database at {self.database_path}")
             self.create_tables()
+            self.open_read_connections()
         except sqlite3.Error as e:
             logging.error(f"Database connection error: {e}")
             self.connection = None
@@ -87,15 +174,33 @@ class DatabaseCog(commands.Cog):
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS wordle_scores (
                     id INTEGER PRIMARY KEY,
-                    user_id TEXT NOT NULL,
-                    guild_id TEXT NOT NULL,
+                    user_id INTEGER NOT NULL,
+                    guild_id INTEGER NOT NULL,
                     username TEXT,
                     score INTEGER NOT NULL,
                     date TEXT NOT NULL,
                     timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
+            self.migrate_schema()
+            # Weekly leaderboard filters on guild_id + date range and reads user_id, username and
+            # score - carrying them in the index lets SQLite answer it without touching the table.
+            # Supersedes the older (guild_id, date) index, which is a prefix of this one
+            cursor.execute('DROP INDEX IF EXISTS idx_scores_guild_date')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_scores_leaderboard
+                ON wordle_scores (guild_id, date, user_id, username, score)
+            ''')
+            # One score per user per guild per day (migrate_schema cleared older duplicates)
+            cursor.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_scores_user_guild_date
+                ON wordle_scores (user_id, guild_id, date)
+            ''')
             self.connection.commit()
+            # Give the planner statistics for the indexes once; PRAGMA optimize keeps them fresh after that
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                cursor.execute("ANALYZE")
             logging.info("Database tables ensured.")
             
             
@@ -104,10 +209,150 @@ class DatabaseCog(commands.Cog):
             self.connection = None
     
 
+    def migrate_schema(self) -> None:
+        """Bring a database created by an older version of the bot up to SCHEMA_VERSION.
+
+        Version 1 stores Discord IDs as INTEGER instead of TEXT: an 8-byte integer instead
+        of a ~19 character string per ID, so rows and every index on them shrink. SQLite
+        can't change a column type in place, so the table is rebuilt in one transaction
+        (keeping row ids); its indexes are dropped with it and recreated by create_tables.
+
+        Version 2 allows one score per user per guild per day; see remove_duplicate_scores.
+        """
+        (version,) = self.connection.execute("PRAGMA user_version").fetchone()
+        if version >= self.SCHEMA_VERSION:
+            return
+        column_types = {
+            name: declared_type
+            for _, name, declared_type, *_ in self.connection.execute("PRAGMA table_info(wordle_scores)")
+        }
+        if column_types.get("user_id") == "TEXT":
+            logging.warning("Migrating wordle_scores to INTEGER user and guild IDs")
+            self.connection.executescript('''
+                BEGIN;
+                CREATE TABLE wordle_scores_v1 (
+                    id INTEGER PRIMARY KEY,
+                    user_id INTEGER NOT NULL,
+                    guild_id INTEGER NOT NULL,
+                    username TEXT,
+                    score INTEGER NOT NULL,
+                    date TEXT NOT NULL,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                );
+                INSERT INTO wordle_scores_v1 (id, user_id, guild_id, username, score, date, timestamp)
+                    SELECT id, CAST(user_id AS INTEGER), CAST(guild_id AS INTEGER), username, score, date, timestamp
+                    FROM wordle_scores;
+                DROP TABLE wordle_scores;
+                ALTER TABLE wordle_scores_v1 RENAME TO wordle_scores;
+                COMMIT;
+            ''')
+        if version < 2:
+            self.remove_duplicate_scores()
+        # PRAGMA doesn't take bound parameters; SCHEMA_VERSION is a class constant int
+        self.connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def remove_duplicate_scores(self) -> None:
+        """Schema version 2: keep only the first score per user, guild and day.
+
+        Databases from before the unique index may hold several scores for the same user
+        and day, which would stop create_tables from building it. The earliest row of each
+        group is kept; every row removed is logged with its values so it can be restored
+        by hand. Runs once, from migrate_schema, inside the caller's transaction.
+        """
+        duplicates = self.connection.execute('''
+            SELECT id, user_id, guild_id, username, score, date FROM wordle_scores
+            WHERE id NOT IN (SELECT MIN(id) FROM wordle_scores GROUP BY user_id, guild_id, date)
+            ORDER BY id
+        ''').fetchall()
+        if not duplicates:
+            return
+        for row_id, user_id, guild_id, username, score, date in duplicates:
+            logging.warning(
+                f"Removing duplicate score id={row_id} user_id={user_id} guild_id={guild_id} "
+                f"username={username!r} score={score} date={date}"
+            )
+        self.connection.executemany("DELETE FROM wordle_scores WHERE id = ?", [(row[0],) for row in duplicates])
+        logging.warning(f"Removed {len(duplicates)} duplicate scores while migrating to one score per user per day")
+
+    def open_read_connections(self) -> None:
+        """Open the pool of read-only connections used by execute_read_query.
+
+        Under WAL a reader sees the last committed snapshot while a write is in flight,
+        so reads don't have to queue on self.lock. Skipped for in-memory databases,
+        which a second connection can't see.
+        """
+        if not self.connection or self.database_path == ":memory:":
+            return
+        uri = Path(self.database_path).resolve().as_uri() + "?mode=ro"
+        connections = []
+        try:
+            for _ in range(self.READ_POOL_SIZE):
+                connection = sqlite3.connect(
+                    uri, uri=True, check_same_thread=False, cached_statements=self.STATEMENT_CACHE_SIZE
+                )
+                connections.append(connection)
+                for pragma in self.READ_CONNECTION_PRAGMAS:
+                    connection.execute(pragma)
+        except sqlite3.Error as e:
+            logging.warning(f"Read-only connections unavailable, reads will share the main connection: {e}")
+            for connection in connections:
+                connection.close()
+            return
+        pool = queue.SimpleQueue()
+        for connection in connections:
+            pool.put(connection)
+        with self.read_pool_lock:
+            self.read_pool = pool
+            self.read_connections = connections
+
+    def close_read_connections(self) -> None:
+        """Close every read-only connection; reads fall back to the main connection afterwards.
+
+        Waits for connections checked out by in-flight reads to come back to the pool first,
+        so no read is left holding a closed connection.
+        """
+        with self.read_pool_lock:
+            connections, self.read_connections = self.read_connections, []
+            for _ in connections:
+                self.read_pool.get().close()
+
     def close_connection(self) -> None:
-        if self.connection:
+        """Close the shared connection. Safe to call more than once."""
+        self.close_read_connections()
+        with self.lock:
+            if not self.connection:
+                return
+            try:
+                # Refresh planner statistics for the indexes used since startup (bounded work)
+                self.connection.execute("PRAGMA analysis_limit=1000")
+                self.connection.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logging.warning(f"Could not optimize database before closing: {e}")
             self.connection.close()
-            logging.info("Database connection closed.")
+            self.connection = None
+        atexit.unregister(self.close_connection)
+        logging.info("Database connection closed.")
+
+    def run_maintenance(self) -> None:
+        """Checkpoint the WAL back into the database file and refresh planner statistics.
+
+        Truncating the WAL keeps it from growing between the automatic checkpoints,
+        which only ever copy pages back and never shrink the file.
+        """
+        if not self.connection:
+            return
+        try:
+            with self.lock:
+                busy, wal_pages, checkpointed = self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+                self.connection.execute("PRAGMA optimize")
+            logging.debug("WAL checkpoint: busy=%d, %d of %d pages checkpointed", busy, checkpointed, wal_pages)
+        except sqlite3.Error as e:
+            logging.warning(f"Database maintenance failed: {e}")
+
+    @tasks.loop(minutes=MAINTENANCE_INTERVAL)
+    async def maintenance_task(self) -> None:
+        """Run periodic database maintenance off the event loop."""
+        await asyncio.to_thread(self.run_maintenance)
 
     def execute_query(self, query: str, params: tuple = ()) -> list:
         """
@@ -130,146 +375,263 @@ class DatabaseCog(commands.Cog):
             return []
 
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-            self.connection.commit()
-            logging.info(f"Executed query: {query} with params: {params}")
+            with self.lock:
+                results = self.connection.execute(query, params).fetchall()
+                # Only writes open a transaction; a plain SELECT has nothing to commit
+                if self.connection.in_transaction:
+                    self.connection.commit()
+            logging.debug("Executed query: %s with params: %s", query, params)
             return results
         except sqlite3.Error as e:
             logging.error(f"Database query error: {e}")
             return []
 
-    def save_wordle_score(self, user_id: int, guild_id: int, username: str, score: int, date: str) -> bool:
+    def execute_read_query(self, query: str, params: tuple = ()) -> list:
+        """
+        Run a SELECT on a pooled read-only connection and return the results.
+        
+        Waits for a free connection if all of them are busy, and falls back to
+        execute_query when there are no read-only connections.
+        
+        Args:
+            query: The SELECT statement to run.
+            params: Optional parameters for the SQL query.
+        
+        Returns:
+            List of tuples containing the query results.
+        """
+        with self.read_pool_lock:
+            pool = self.read_pool if self.read_connections else None
+            connection = pool.get() if pool else None
+        if connection is None:
+            return self.execute_query(query, params)
+        try:
+            results = connection.execute(query, params).fetchall()
+            logging.debug("Executed read query: %s with params: %s", query, params)
+            return results
+        except sqlite3.ProgrammingError as e:
+            # Unusable read connection (e.g. closed underneath us) - the main connection can still answer
+            logging.warning(f"Read-only connection failed, retrying on the main connection: {e}")
+            return self.execute_query(query, params)
+        except sqlite3.Error as e:
+            logging.error(f"Database read query error: {e}")
+            return []
+        finally:
+            pool.put(connection)
+
+    def upsert_wordle_scores(self, rows: list) -> bool:
+        """Save a batch of Wordle scores in a single transaction, replacing existing ones.
+
+        Args:
+            rows: List of (user_id, guild_id, username, score, date) tuples.
+
+        Returns:
+            True if every score was saved, False if the batch was rolled back.
         """
-        Save a Wordle score to the database.
+        if not self.connection:
+            logging.error("No database connection.")
+            return False
+        try:
+            with self.lock, self.connection:
+                self.connection.executemany(self.UPSERT_SCORE_QUERY, rows)
+            logging.debug("Saved %d scores in one batch.", len(rows))
+            return True
+        except sqlite3.Error as e:
+            logging.error(f"Error saving scores: {e}")
+            return False
+
+    def save_if_new(self, user_id: int, guild_id: int, username: str, score: int, date: str) -> bool:
+        """
+        Save a Wordle score unless the user already has one for that date in that guild.
+
+        The check and the insert are one statement, so two saves racing for the same
+        user and day can never both succeed or overwrite each other.
 
         Args:
             user_id: Discord user ID.
             guild_id: Discord server (guild) ID.
             username: Discord username.
             score: Number of attempts (1-6) or 8 for failure.
-            date: Date when the report was processed (YYYY-MM-DD format).
-                  * NOTE: Bot processes at 00:20, so this represents the day
-                  * the report was received, not necessarily the puzzle date.
+            date: Date of the score (YYYY-MM-DD format).
 
         Returns:
-            True if the score was saved successfully, False otherwise.
+            True if the score was saved, False if one was already on record or the save failed.
         """
         if not self.connection:
             logging.error("No database connection.")
             return False
-        query = """INSERT OR REPLACE INTO wordle_scores 
-                   (user_id, guild_id, username, score, date) 
-                   VALUES (?, ?, ?, ?, ?)"""
-        params = (user_id, guild_id, username, score, date)
-        logging.info(f"Saving score for user {username} ({user_id}) in guild {guild_id}: {score} on {date}")
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            self.connection.commit()
-            logging.info("Score saved successfully.")
-            return True
+            with self.lock:
+                cursor = self.connection.execute(self.INSERT_IF_NEW_QUERY, (user_id, guild_id, username, score, date))
+                self.connection.commit()
+            logging.debug("Score for user %s in guild %s on %s saved: %s", user_id, guild_id, date, cursor.rowcount == 1)
+            return cursor.rowcount == 1
         except sqlite3.Error as e:
             logging.error(f"Error saving score: {e}")
             return False
-    
-    def has_duplicate_submission(self, user_id: int, guild_id: int, date: str) -> bool:
-        """Check if a user has already submitted a score for a specific date in a guild.
+
+    def insert_new_wordle_scores(self, rows: list) -> tuple:
+        """Save a batch of Wordle scores in a single transaction.
+
+        Rows that already have a score for that user, guild and date are skipped.
+
+        Args:
+            rows: List of (user_id, guild_id, username, score, date) tuples.
+
+        Returns:
+            Tuple of (number of scores saved, number skipped as duplicates).
+        """
+        if not self.connection:
+            logging.error("No database connection.")
+            return 0, 0
+        try:
+            with self.lock, self.connection:
+                cursor = self.connection.executemany(self.INSERT_IF_NEW_QUERY, rows)
+            saved = cursor.rowcount
+            logging.debug("Saved %d of %d scores in one batch.", saved, len(rows))
+            return saved, len(rows) - saved
+        except sqlite3.Error as e:
+            logging.error(f"Error saving scores: {e}")
+            return 0, 0
+
+    def get_user_ids_for_date(self, guild_id: int, date: str) -> set:
+        """Get the IDs of every user with a score on a specific date in a guild.
 
         Args:
-            user_id (int): The ID of the user.
             guild_id (int): The ID of the guild (server).
             date (str): The date to check (YYYY-MM-DD format).
 
         Returns:
-            bool: True if a duplicate submission exists, False otherwise.
+            set: User IDs as ints.
         """
-        query = "SELECT id FROM wordle_scores WHERE user_id = ? AND guild_id = ? AND date = ?"
-        params = (user_id, guild_id, date)
-        logging.info(f"Checking for duplicate submission for user {user_id} in guild {guild_id} on {date}")
-        result = self.execute_query(query, params)
-        logging.info(f"Duplicate submission check result: {bool(result)}")
-        return bool(result)
-
-    def delete_user_score(self, user_id: int, guild_id: int, date: str) -> bool:
-        """Delete existing score for a user on a specific date in a guild.
-        
+        rows = self.execute_read_query(self.USER_IDS_FOR_DATE_QUERY, (guild_id, date))
+        return {user_id for (user_id,) in rows}
+
+    def delete_guild_scores(self, guild_id: int) -> int:
+        """Delete every score recorded in a guild.
+
         Args:
-            user_id: Discord user ID
             guild_id: Discord guild ID
-            date: Date string in YYYY-MM-DD format
-            
+
         Returns:
-            True if deletion was successful, False otherwise
+            Number of scores deleted, 0 if there were none or the delete failed.
         """
+        if not self.connection:
+            logging.error("No database connection.")
+            return 0
         try:
-            if not self.connection:
-                logging.error("No database connection.")
-                return False
-                
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                DELETE FROM wordle_scores 
-                WHERE user_id = ? AND guild_id = ? AND date = ?
-            """, (user_id, guild_id, date))
-            
-            deleted_count = cursor.rowcount
-            self.connection.commit()
-            
-            if deleted_count > 0:
-                logging.info(f"Deleted {deleted_count} existing scores for user {user_id} on {date}")
-            
-            return True
-            
-        except Exception as e:
-            logging.error(f"Error deleting user score: {e}")
-            return False
+            # The DELETE reports its own row count, so no separate COUNT(*) that could disagree with it
+            with self.lock, self.connection:
+                cursor = self.connection.execute(self.DELETE_GUILD_SCORES_QUERY, (guild_id,))
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logging.error(f"Error deleting guild scores: {e}")
+            return 0
+
+    def _drain_log_batch(self, first: str) -> tuple:
+        """
+        Join first with whatever else is already queued, up to the batch size and length limits.
+        
+        Args:
+            first: The message that started this batch.
+        
+        Returns:
+            Tuple of (joined batch, message that didn't fit and starts the next batch or None).
+        """
+        if len(first) > self.LOG_BATCH_CHARS:
+            # A single oversized message (e.g. a traceback) goes out in pieces; the rest starts the next batch.
+            # Cut at a line break where possible, leaving room to close the code span emit opened
+            cut = first.rfind("\n", 0, self.LOG_BATCH_CHARS - 1)
+            if cut <= 0:
+                cut = self.LOG_BATCH_CHARS - 1
+            head, tail = first[:cut], first[cut:].lstrip("\n")
+            if tail and head.count("`") % 2:
+                head, tail = head + "`", "`" + tail
+            return head, tail or None
+        lines = [first]
+        length = len(first)
+        while len(lines) < self.LOG_BATCH_SIZE:
+            try:
+                message = self.log_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if length + 1 + len(message) > self.LOG_BATCH_CHARS:
+                return "\n".join(lines), message
+            lines.append(message)
+            length += 1 + len(message)
+        return "\n".join(lines), None
 
     async def log_processor(self) -> None:
-        """Background task to process log messages and send them to Discord channel."""
+        """Background task to send queued log messages to the Discord channel in batches."""
+        last_sent = 0.0
+        carry = None  # message that didn't fit in the previous batch
         try:
             while not self.bot.is_closed():
                 try:
-                    message = await asyncio.wait_for(self.log_queue.get(), timeout=self.LOG_PROCESSOR_TIMEOUT)
+                    if carry is None:
+                        # Park on the queue itself; unload cancels the task, so no polling timeout is needed
+                        carry = await self.log_queue.get()
+                    
+                    # Only wait out whatever is left of the rate limit window since the last send
+                    wait = self.LOG_SEND_DELAY - (monotonic() - last_sent)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    batch, carry = self._drain_log_batch(carry)
                     
                     if self.log_channel_id:
                         channel = self.bot.get_channel(self.log_channel_id)
                         if channel:
-                            await channel.send(message)
-                    
-                    await asyncio.sleep(self.LOG_SEND_DELAY)
+                            await channel.send(batch)
+                    last_sent = monotonic()
                     
-                except asyncio.TimeoutError:
-                    continue
                 except Exception as e:
                     # Log processor errors shouldn't crash the bot
+                    carry = None
                     await asyncio.sleep(self.LOG_ERROR_RETRY_DELAY)
         except asyncio.CancelledError:
             pass
 
+    def attach_log_handler(self) -> None:
+        """Start forwarding root logger records to Discord through a QueueHandler/QueueListener pair."""
+        if self.log_listener:
+            return
+        record_queue = queue.SimpleQueue()
+        self.log_queue_handler = logging.handlers.QueueHandler(record_queue)
+        self.log_listener = logging.handlers.QueueListener(
+            record_queue, self.discord_handler, respect_handler_level=True
+        )
+        self.log_listener.start()
+        logging.getLogger().addHandler(self.log_queue_handler)
+
+    def detach_log_handler(self) -> None:
+        """Stop forwarding root logger records to Discord."""
+        if not self.log_listener:
+            return
+        logging.getLogger().removeHandler(self.log_queue_handler)
+        self.log_listener.stop()
+        self.log_queue_handler = None
+        self.log_listener = None
+
     @commands.Cog.listener()
     async def on_ready(self) -> None:
         """Start log processor when bot is ready."""
         if self.log_processor_task is None:
             self.log_processor_task = asyncio.create_task(self.log_processor())
+        if not self.maintenance_task.is_running():
+            self.maintenance_task.start()
 
-    @commands.Cog.listener()
-    async def on_cog_unload(self) -> None:
+    async def cog_unload(self) -> None:
         """Cleanup when the cog is unloaded."""
         # Remove handler from root logger
-        root_logger = logging.getLogger()
-        if hasattr(self, 'discord_handler'):
-            try:
-                root_logger.removeHandler(self.discord_handler)
-            except ValueError:
-                pass  
+        self.detach_log_handler()
         
         # Cancel log processor task
         if self.log_processor_task and hasattr(self.log_processor_task, 'done') and not self.log_processor_task.done():
             self.log_processor_task.cancel()
-            
-        self.close_connection()
+        self.maintenance_task.cancel()
+        
+        # Closing waits for in-flight reads to hand back their connections - not on the event loop
+        await asyncio.to_thread(self.close_connection)
 
     @commands.command(aliases=["dbstats"])
     @commands.is_owner()
@@ -282,34 +644,27 @@ class DatabaseCog(commands.Cog):
         Example:
             woguri db_stats
         """
-        logging.info("Gathering database statistics.")
-        total_query = "SELECT COUNT(*) FROM wordle_scores"
-        total_result = self.execute_query(total_query)
-        total_count = total_result[0][0] if total_result else 0
-        logging.info(f"Total records in database: {total_count}")
-        
-        guild_query = "SELECT COUNT(*) FROM wordle_scores WHERE guild_id = ?"
-        guild_result = self.execute_query(guild_query, (ctx.guild.id,))
-        guild_count = guild_result[0][0] if guild_result else 0
-        logging.info(f"Records for guild {ctx.guild.id}: {guild_count}")
-        
-        servers_query = "SELECT COUNT(DISTINCT guild_id) FROM wordle_scores"
-        servers_result = self.execute_query(servers_query)
-        servers_count = servers_result[0][0] if servers_result else 0
+        logging.debug("Gathering database statistics.")
+        # All three counts in one statement - one trip through the lock and the worker thread
+        stats_query = """SELECT (SELECT COUNT(*) FROM wordle_scores),
+                                (SELECT COUNT(*) FROM wordle_scores WHERE guild_id = ?),
+                                (SELECT COUNT(DISTINCT guild_id) FROM wordle_scores)"""
+        stats_result = await asyncio.to_thread(self.execute_read_query, stats_query, (ctx.guild.id,))
+        total_count, guild_count, servers_count = stats_result[0] if stats_result else (0, 0, 0)
         logging.info(f"Database stats - Total: {total_count}, This Guild: {guild_count}, Total Guilds: {servers_count}")
         
         embed = discord.Embed(title="Database Statistics", color=0x4d79ff)
         embed.add_field(name="Total Records", value=total_count, inline=True)
         embed.add_field(name="This Server", value=guild_count, inline=True)  
         embed.add_field(name="Total Servers", value=servers_count, inline=True)
-        logging.info("Sending database statistics embed.")
+        logging.debug("Sending database statistics embed.")
         
         await ctx.send(embed=embed)
 
     @commands.command(aliases=["dbguilds"])
     @commands.is_owner() 
     async def db_guilds(self, ctx: commands.Context) -> None:
-        """List all servers using the bot.
+        """List the servers with the most records, up to DB_GUILDS_LIMIT (10).
         
         Args:
             ctx: The command context.
@@ -321,9 +676,10 @@ class DatabaseCog(commands.Cog):
                         MAX(date) as latest_date
                 FROM wordle_scores 
                 GROUP BY guild_id 
-                ORDER BY records DESC"""
+                ORDER BY records DESC
+                LIMIT ?"""
         
-        results = self.execute_query(query)
+        results = await asyncio.to_thread(self.execute_read_query, query, (self.DB_GUILDS_LIMIT,))
         logging.info(f"Retrieved {len(results)} guilds from database.")
         
         if not results:
@@ -333,15 +689,10 @@ class DatabaseCog(commands.Cog):
         
         embed = discord.Embed(title="Database Servers", color=0x4d79ff)
         
-        for guild_id, count, latest in results[:10]:  # Show top 10
-            guild_name = f"Guild {guild_id}"
-            try:
-                guild = self.bot.get_guild(int(guild_id))
-                if guild:
-                    guild_name = guild.name
-                    logging.info(f"Found guild name: {guild_name} for ID: {guild_id}")
-            except Exception as e:
-                logging.error(f"Error retrieving guild name for ID {guild_id}: {e}")
+        for guild_id, count, latest in results:
+            # IDs come back as ints, so this is a plain dict lookup in the bot's guild cache
+            guild = self.bot.get_guild(guild_id)
+            guild_name = guild.name if guild else f"Guild {guild_id}"
 
             embed.add_field(
                 name=guild_name,
@@ -369,8 +720,6 @@ class DatabaseCog(commands.Cog):
             await ctx.send("Limit capped at 50 entries. You're being a bit greedy, don't you think?")
         
         try:
-            cursor = self.connection.cursor()
-            
             # Build query based on filters
             base_query = "SELECT username, score, date, guild_id, user_id FROM wordle_scores"
             conditions = []
@@ -379,8 +728,9 @@ class DatabaseCog(commands.Cog):
             # Add date filter if provided
             if date and date.lower() != "none":
                 try:
-                    # Validate date format
-                    datetime.strptime(date, '%Y-%m-%d')
+                    # Validate date format; the round trip rejects other ISO forms such as 20240601
+                    if Date.fromisoformat(date).isoformat() != date:
+                        raise ValueError(date)
                     conditions.append("date = ?")
                     params.append(date)
                 except ValueError:
@@ -390,7 +740,7 @@ class DatabaseCog(commands.Cog):
             # Add user filter if provided
             if user:
                 conditions.append("user_id = ?")
-                params.append(str(user.id))
+                params.append(user.id)
             
             # Combine conditions
             if conditions:
@@ -402,9 +752,8 @@ class DatabaseCog(commands.Cog):
             query += " ORDER BY date DESC, username LIMIT ?"
             params.append(limit)
             
-            logging.info(f"Executing query: {query} with params: {params}")
-            cursor.execute(query, params)
-            results = cursor.fetchall()
+            logging.debug("Executing query: %s with params: %s", query, params)
+            results = await asyncio.to_thread(self.execute_read_query, query, tuple(params))
             
             if not results:
                 filter_parts = []
@@ -417,9 +766,6 @@ class DatabaseCog(commands.Cog):
                 await ctx.send(f"No results found{filter_text}. Try again if you want.")
                 return
             
-            # Create formatted output
-            output = "```\n"
-            
             # Add header with filter info
             header_parts = [f"Showing {len(results)} entries"]
             if date and date.lower() != "none":
@@ -427,144 +773,22 @@ class DatabaseCog(commands.Cog):
             if user:
                 header_parts.append(f"for {user.display_name}")
             
-            output += f"{' '.join(header_parts)}\n"
-            output += "=" * 60 + "\n"
-            output += f"{'Username':<15} {'Score':<5} {'Date':<12} {'Guild':<10}\n"
-            output += "-" * 60 + "\n"
-            
+            # Collect the lines and join once rather than growing a string row by row
+            output = ["```\n", f"{' '.join(header_parts)}\n", self.RECENT_SCORES_COLUMNS]
             for username, score, date_col, guild_id, user_id in results:
                 username_display = username[:14] if username else "Unknown"
                 guild_display = str(guild_id)[:8] if guild_id else "Unknown"
                 
-                output += f"{username_display:<15} {score:<5} {date_col:<12} {guild_display:<10}\n"
+                output.append(f"{username_display:<15} {score:<5} {date_col:<12} {guild_display:<10}\n")
             
-            output += "```"
-            await ctx.send(output)
+            output.append("```")
+            await ctx.send("".join(output))
                 
         except Exception as e:
             logging.error(f"Error in recent_scores command: {e}")
             await ctx.message.add_reaction("❌")
             await ctx.send("Something went wrong with your request. Probably your input.")
 
-    @commands.command(name="show_duplicates", aliases=["duplicates", "dupes"])
-    @commands.is_owner()
-    async def show_duplicates(self, ctx: commands.Context, guild_id: int = None) -> None:
-        """Show all duplicate submissions in the database."""
-        try:
-            if not self.connection:
-                logging.error("No database connection.")
-                await ctx.message.add_reaction("❌")
-                await ctx.send("Database connection error. Very problematic.")
-                return
-
-            cursor = self.connection.cursor()
-            
-            if guild_id:
-                cursor.execute("""
-                    SELECT user_id, guild_id, date, COUNT(*) as count
-                    FROM wordle_scores 
-                    WHERE guild_id = ?
-                    GROUP BY user_id, guild_id, date 
-                    HAVING COUNT(*) > 1
-                    ORDER BY count DESC, date DESC
-                """, (guild_id,))
-            else:
-                cursor.execute("""
-                    SELECT user_id, guild_id, date, COUNT(*) as count
-                    FROM wordle_scores 
-                    GROUP BY user_id, guild_id, date 
-                    HAVING COUNT(*) > 1
-                    ORDER BY count DESC, date DESC
-                """)
-            
-            duplicates = cursor.fetchall()
-            
-            if not duplicates:
-                await ctx.send("No duplicate entries found. Clean database ✨")
-                return
-            
-            output = "```\nDuplicate Submissions Found:\n"
-            output += "User ID       Guild ID     Date         Count\n"
-            output += "=" * 50 + "\n"
-            
-            for user_id, g_id, date, count in duplicates:
-                output += f"{user_id:<13} {g_id:<12} {date:<12} {count}\n"
-            
-            output += "```"
-            await ctx.send(output)
-            
-        except Exception as e:
-            logging.error(f"Error showing duplicates: {e}")
-            await ctx.message.add_reaction("❌")
-            await ctx.send("Error checking for duplicates. The system must be confused.")
-
-    @commands.command(name="clean_duplicates", aliases=["cleanup", "dedupe"])
-    @commands.is_owner()
-    async def clean_duplicates(self, ctx: commands.Context, guild_id: int = None) -> None:
-        """Remove duplicate submissions, keeping the first occurrence."""
-        try:
-            if not self.connection:
-                logging.error("No database connection.")
-                await ctx.message.add_reaction("❌")
-                await ctx.send("Database connection error. Very problematic.")
-                return
-
-            cursor = self.connection.cursor()
-            
-            # First, show what will be cleaned
-            if guild_id:
-                cursor.execute("""
-                    SELECT user_id, guild_id, date, COUNT(*) as count
-                    FROM wordle_scores 
-                    WHERE guild_id = ?
-                    GROUP BY user_id, guild_id, date 
-                    HAVING COUNT(*) > 1
-                """, (guild_id,))
-            else:
-                cursor.execute("""
-                    SELECT user_id, guild_id, date, COUNT(*) as count
-                    FROM wordle_scores 
-                    GROUP BY user_id, guild_id, date 
-                    HAVING COUNT(*) > 1
-                """)
-            
-            duplicates = cursor.fetchall()
-            
-            if not duplicates:
-                await ctx.send("No duplicates to clean. Database is already pristine ✨")
-                return
-            
-            # Clean duplicates by keeping only the row with the smallest id (first inserted)
-            if guild_id:
-                cursor.execute("""
-                    DELETE FROM wordle_scores 
-                    WHERE id NOT IN (
-                        SELECT MIN(id) 
-                        FROM wordle_scores 
-                        WHERE guild_id = ?
-                        GROUP BY user_id, guild_id, date
-                    ) AND guild_id = ?
-                """, (guild_id, guild_id))
-            else:
-                cursor.execute("""
-                    DELETE FROM wordle_scores 
-                    WHERE id NOT IN (
-                        SELECT MIN(id) 
-                        FROM wordle_scores 
-                        GROUP BY user_id, guild_id, date
-                    )
-                """)
-            
-            deleted_count = cursor.rowcount
-            self.connection.commit()
-            
-            await ctx.send(f"Cleaned up {deleted_count} duplicate entries! Database is now spotless ✨")
-            
-        except Exception as e:
-            logging.error(f"Error cleaning duplicates: {e}")
-            await ctx.message.add_reaction("❌")
-            await ctx.send("Error cleaning duplicates. Something went terribly wrong.")
-
 async def setup(bot: commands.Bot) -> None:
     """Setup function to add the cog to the bot."""
     await bot.add_cog(DatabaseCog(bot))
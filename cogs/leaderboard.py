@@ -1,51 +1,117 @@
 from discord.ext import commands
 import logging
-from datetime import datetime, time, timedelta
+import asyncio
+from time import monotonic
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+# ISO (year, week) -> (week_start, week_end, header) for the current week only
+_WEEK_CACHE = {}
+
+def _get_week_window(today: datetime) -> tuple:
+    """Return the Monday-Sunday week containing today as formatted strings.
+
+    Args:
+        today (datetime): Any moment within the week.
+    Returns:
+        tuple: (week_start 'YYYY-MM-DD', week_end 'YYYY-MM-DD', '*Week of ...*' header line)
+    """
+    iso_week = today.isocalendar()[:2]
+    window = _WEEK_CACHE.get(iso_week)
+    if window is None:
+        week_start = today.date() - timedelta(days=today.weekday())  # 0=Monday, 6=Sunday
+        week_end = week_start + timedelta(days=6)
+        window = (week_start.isoformat(), week_end.isoformat(), f"*Week of {week_start:%B %d} - {week_end:%B %d}*")
+        _WEEK_CACHE.clear()
+        _WEEK_CACHE[iso_week] = window
+    return window
+
 
 class LeaderboardCog(commands.Cog):
     """
     Cog to manage the leaderboard related commands.
     """
+    LEADERBOARD_CACHE_TTL = 60.0   # seconds a formatted leaderboard stays fresh
+    LEADERBOARD_CACHE_SIZE = 128   # maximum number of cached (guild, week) leaderboards
+    AVAILABLE_WEEKDAYS_MASK = 1 << 6  # bit per weekday (Monday=0); only Sunday is set
+    AVAILABLE_START_HOUR = 17         # 5 PM, window runs until midnight
+    MEDALS = ("👑", "🥈", "🥉")        # prefixes for the top three places
+    LEADERBOARD_SIZE = 10             # places shown on the weekly leaderboard
+    
+    # Fixed SQL string, so sqlite3's statement cache reuses the prepared statement
+    WEEKLY_LEADERBOARD_QUERY = '''
+        SELECT username, SUM(score) as total_score, COUNT(*) as games_played
+        FROM wordle_scores 
+        WHERE guild_id = ? AND date BETWEEN ? AND ?
+        GROUP BY user_id, username
+        ORDER BY total_score ASC
+        LIMIT ?
+    '''
+
     def __init__(self, bot) -> None:
         self.bot = bot
+        # (guild_id, week_start) -> (cached_at, leaderboard_text, doa_winner)
+        self._lb_cache = OrderedDict()
+
+    def _get_cached_leaderboard(self, key: tuple) -> tuple:
+        """Return the cached (leaderboard_text, doa_winner) for key, or None if missing/stale."""
+        entry = self._lb_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, leaderboard, doa_winner = entry
+        if monotonic() - cached_at >= self.LEADERBOARD_CACHE_TTL:
+            del self._lb_cache[key]
+            return None
+        self._lb_cache.move_to_end(key)
+        return leaderboard, doa_winner
+
+    def _store_cached_leaderboard(self, key: tuple, leaderboard: str, doa_winner: bool) -> None:
+        """Cache a formatted leaderboard, evicting the least recently used entry when full."""
+        self._lb_cache[key] = (monotonic(), leaderboard, doa_winner)
+        self._lb_cache.move_to_end(key)
+        while len(self._lb_cache) > self.LEADERBOARD_CACHE_SIZE:
+            self._lb_cache.popitem(last=False)
+
+    def invalidate_leaderboard_cache(self, guild_id: int) -> None:
+        """Drop every cached leaderboard for a guild so new scores show up immediately.
+
+        Args:
+            guild_id (int): The ID of the guild whose scores changed.
+        """
+        for key in [key for key in self._lb_cache if key[0] == guild_id]:
+            del self._lb_cache[key]
 
-    def is_leaderboard_available(self) -> bool:
+    def is_leaderboard_available(self, now: datetime = None) -> bool:
         """
         Check if leaderboard is available (Sunday 5 PM to Sunday 11:59 PM only).
         
+        Args:
+            now (datetime, optional): Moment to check, captured by the caller. Defaults to the current time.
         Returns:
             bool: True if current time is within Sunday 17:00 to Sunday 23:59
         """
-        now = datetime.now()
-        
-        # Check if it's Sunday (weekday 6)
-        if now.weekday() != 6:
-            return False
-        
-        # Check if time is between 5 PM (17:00) and 11:59 PM (23:59)
-        current_time = now.time()
-        start_time = time(17, 0)   # 5 PM
-        end_time = time(23, 59, 59)  # 11:59:59 PM
+        if now is None:
+            now = datetime.now()
         
-        return start_time <= current_time <= end_time
+        # Sunday only, from 5 PM (17:00) through 11:59:59 PM
+        return bool((1 << now.weekday()) & self.AVAILABLE_WEEKDAYS_MASK) and self.AVAILABLE_START_HOUR <= now.hour
     
-    def _get_next_sunday_5pm(self) -> datetime:
+    def _get_next_sunday_5pm(self, now: datetime = None) -> datetime:
         """Calculate when the leaderboard will next be available.
         
+        Args:
+            now (datetime, optional): Moment to count from, captured by the caller. Defaults to the current time.
         Returns:
             datetime: The next Sunday at 5 PM datetime object.
         """
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         
-        # Calculate days until next Sunday
+        # Days until next Sunday (0 when today is Sunday)
         days_until_sunday = (6 - now.weekday()) % 7
-        if days_until_sunday == 0 and now.time() > time(23, 59, 59):
-            days_until_sunday = 7
-        elif days_until_sunday == 0 and now.time() < time(17, 0):
-            days_until_sunday = 0
         
         next_sunday = now + timedelta(days=days_until_sunday)
-        return next_sunday.replace(hour=17, minute=0, second=0, microsecond=0)
+        return next_sunday.replace(hour=self.AVAILABLE_START_HOUR, minute=0, second=0, microsecond=0)
 
     @commands.command(aliases=["lb"])
     async def leaderboard(self, ctx: commands.Context) -> None:
@@ -59,24 +125,33 @@ class LeaderboardCog(commands.Cog):
             woguri leaderboard
 
         """
-        if not self.is_leaderboard_available():
-            next_sunday = self._get_next_sunday_5pm()
+        now = datetime.now()
+        if not self.is_leaderboard_available(now):
+            next_sunday = self._get_next_sunday_5pm(now)
             await ctx.send(f"The weekly leaderboard is only available on Sundays from 5 PM to midnight. Next available: {next_sunday.strftime('%A, %B %d at %I:%M %p')}")
             return
     
-        await self.produce_leaderboard(ctx)
+        await self.produce_leaderboard(ctx, now)
 
-    async def produce_leaderboard(self, ctx: commands.Context) -> None:
+    async def produce_leaderboard(self, ctx: commands.Context, now: datetime = None) -> None:
         """Produce the leaderboard for the current week.
 
         Args:
             ctx (commands.Context): The command context.
+            now (datetime, optional): Moment whose week to show, captured by the caller. Defaults to the current time.
         """
-        today = datetime.now()
-        days_since_monday = today.weekday()  # 0=Monday, 6=Sunday
-        week_start = today - timedelta(days=days_since_monday)
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_end = week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)
+        if now is None:
+            now = datetime.now()
+        week_start, week_end, week_header = _get_week_window(now)
+        
+        cache_key = (ctx.guild.id, week_start)
+        cached = self._get_cached_leaderboard(cache_key)
+        if cached:
+            leaderboard, doa_winner = cached
+            await ctx.send(leaderboard)
+            await self._celebrate_if_doa_winner(ctx, doa_winner)
+            logging.info(f"Weekly leaderboard served from cache for guild {ctx.guild.id}")
+            return
         
         # Get database cog for non-blocking operations
         database_cog = self.bot.get_cog('DatabaseCog')
@@ -84,16 +159,8 @@ class LeaderboardCog(commands.Cog):
             await ctx.send("Database unavailable.")
             return
             
-        query = '''
-            SELECT username, SUM(score) as total_score, COUNT(*) as games_played
-            FROM wordle_scores 
-            WHERE guild_id = ? AND date BETWEEN ? AND ?
-            GROUP BY user_id, username
-            ORDER BY total_score ASC
-            LIMIT 10
-        '''
-        params = (ctx.guild.id, week_start.strftime('%Y-%m-%d'), week_end.strftime('%Y-%m-%d'))
-        results = database_cog.execute_query(query, params)
+        params = (ctx.guild.id, week_start, week_end, self.LEADERBOARD_SIZE)
+        results = await asyncio.to_thread(database_cog.execute_read_query, self.WEEKLY_LEADERBOARD_QUERY, params)
         logging.info(f"Top scores queried for guild {ctx.guild.id}")
         
         if not results:
@@ -102,22 +169,28 @@ class LeaderboardCog(commands.Cog):
             return
         
         # Format leaderboard
-        leaderboard = "**Weekly Wordle Leaderboard**\n"
-        leaderboard += f"*Week of {week_start.strftime('%B %d')} - {week_end.strftime('%B %d')}*\n\n"
-
-        for i, (username, total_score, games) in enumerate(results, 1):
-            if i == 1:
-                leaderboard += f"👑 **{username}**: {total_score} points\n"
-            elif i == 2:
-                leaderboard += f"🥈 **{username}**: {total_score} points\n"
-            elif i == 3:
-                leaderboard += f"🥉 **{username}**: {total_score} points\n"
-            else:
-                leaderboard += f"{i}. **{username}**: {total_score} points\n"
+        lines = ["**Weekly Wordle Leaderboard**", week_header, ""]
+        for i, (username, total_score, games) in enumerate(results):
+            prefix = self.MEDALS[i] if i < len(self.MEDALS) else f"{i + 1}."
+            lines.append(f"{prefix} **{username}**: {total_score} points")
+        lines.append("")
+        leaderboard = "\n".join(lines)
 
         await ctx.send(leaderboard)
         
-        doa_winner = await self.is_doa_winner(ctx)
+        # The top row is already here - no need to re-query for the doa check
+        doa_winner = self._is_doa_top(results)
+        self._store_cached_leaderboard(cache_key, leaderboard, doa_winner)
+        await self._celebrate_if_doa_winner(ctx, doa_winner)
+        logging.info(f"Weekly leaderboard sent for guild {ctx.guild.id}")
+
+    async def _celebrate_if_doa_winner(self, ctx: commands.Context, doa_winner: bool) -> None:
+        """Celebrate with Oguri Cap when 'doa' tops the weekly leaderboard.
+
+        Args:
+            ctx (commands.Context): The command context.
+            doa_winner (bool): Whether 'doa' is this week's winner.
+        """
         if doa_winner:
             # Celebrate with Oguri Cap if cog is available
             oguri_cap_cog = self.bot.get_cog('OguriCapCog')
@@ -127,47 +200,11 @@ class LeaderboardCog(commands.Cog):
                 logging.warning("OguriCapCog not found for doa celebration.")
         else:
             logging.info("doa is not the weekly winner this time.")
-        logging.info(f"Weekly leaderboard sent for guild {ctx.guild.id}")
 
-    async def is_doa_winner(self, ctx: commands.Context) -> bool:
-        """Check if 'doa' is the current week's leaderboard winner.
-
-        Args:
-            ctx (commands.Context): The command context.
-        Returns:
-            bool: True if 'doa' is the top of the leaderboard this week.
-        """
-
-        today = datetime.now()
-        days_since_monday = today.weekday()  # 0=Monday, 6=Sunday
-        week_start = today - timedelta(days=days_since_monday)
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_end = week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)
-        
-        # Get database cog for non-blocking operations
-        database_cog = self.bot.get_cog('DatabaseCog')
-        if not database_cog:
-            logging.warning("DatabaseCog not found when checking for doa winner.")
-            return False
-            
-        query = '''
-            SELECT username, SUM(score) as total_score
-            FROM wordle_scores 
-            WHERE guild_id = ? AND date BETWEEN ? AND ?
-            GROUP BY user_id, username
-            ORDER BY total_score ASC
-            LIMIT 1
-        '''
-        params = (ctx.guild.id, week_start.strftime('%Y-%m-%d'), week_end.strftime('%Y-%m-%d'))
-        results = database_cog.execute_query(query, params)
-        logging.info(f"Top score queried for doa check in guild {ctx.guild.id}")
-        
-        if results and results[0][0].lower() == "doa":
-            logging.info(f"'doa' is the current week's winner in guild {ctx.guild.id}")
-            return True
-        
-        logging.info(f"'doa' is NOT the current week's winner in guild {ctx.guild.id}")
-        return False
+    @staticmethod
+    def _is_doa_top(results: list) -> bool:
+        """Check whether 'doa' holds first place in weekly leaderboard query results."""
+        return bool(results) and results[0][0].lower() == "doa"
 
     @commands.command(aliases=["lbstatus", "lbwhen", "status"])
     @commands.is_owner() 
@@ -178,8 +215,8 @@ class LeaderboardCog(commands.Cog):
             ctx (commands.Context): The command context.
         """
         now = datetime.now().replace(microsecond=0)  # ← Clean time
-        available = self.is_leaderboard_available()
-        next_time = self._get_next_sunday_5pm()
+        available = self.is_leaderboard_available(now)
+        next_time = self._get_next_sunday_5pm(now)
 
         await ctx.send(f"Status report: {now}\nLeaderboard access: {available}\nNext: {next_time}")
 
@@ -200,13 +237,9 @@ class LeaderboardCog(commands.Cog):
             await ctx.send("Database unavailable.")
             return
             
-        count_query = 'SELECT COUNT(*) FROM wordle_scores WHERE guild_id = ?'
-        count_result = database_cog.execute_query(count_query, (ctx.guild.id,))
-        
-        delete_query = 'DELETE FROM wordle_scores WHERE guild_id = ?'
-        database_cog.execute_query(delete_query, (ctx.guild.id,))
+        deleted_count = await asyncio.to_thread(database_cog.delete_guild_scores, ctx.guild.id)
+        self.invalidate_leaderboard_cache(ctx.guild.id)
         
-        deleted_count = count_result[0][0] if count_result and count_result[0] else 0
         await ctx.send(f"Archives cleared. {deleted_count} entries processed.")
         logging.info(f"Leaderboard reset for guild {ctx.guild.id}, {deleted_count} entries deleted.")
 
@@ -5,37 +5,89 @@ import asyncio
 from datetime import datetime
 import logging
 
+# Oguri Cap GIF collection - Real GIF URLs from Tenor!
+_GIFS = {
+    'eating': (
+        'https://c.tenor.com/m5ImGvJ9W_UAAAAC/tenor.gif',  # Oguri Cap eating with help by Bijin
+        'https://c.tenor.com/XfS0xnrKmIYAAAAd/tenor.gif',  # Oguri eating croquette
+        'https://c.tenor.com/MkRliGFdw80AAAAd/tenor.gif',  # Eating with Opera O
+        'https://c.tenor.com/3iVg3SDxgHUAAAAd/tenor.gif',  # Oguri Cap enjoying a donut
+        'https://media.tenor.com/2whuMhugjvoAAAAi/umamusumeprettyderby.gif',  # Oguri Cap waving meat
+        'https://c.tenor.com/Y4y4Pc5OaJUAAAAC/tenor.gif',  # Oguri Cap eating ice cream
+        'https://c.tenor.com/AMtA6XvnPHoAAAAd/tenor.gif',  # Oguri Cap eating biscuits
+        'https://c.tenor.com/3uMulYc14dYAAAAd/tenor.gif',  # Oguri Cap eating like a hamster
+        'https://c.tenor.com/mDKuP2oJ8KIAAAAC/tenor.gif',  # Oguri Cap eating soba
+        'https://c.tenor.com/0HVg47Q6vmcAAAAC/tenor.gif'  # Oguri Cap eating more ice cream
+    ),
+    'victory': (
+        'https://c.tenor.com/yvjzZ4Sfl_AAAAAd/tenor.gif',   # Oguri Cap blue aura
+        'https://c.tenor.com/Gbp-6yjg8cEAAAAd/tenor.gif',  # Late start burst
+        'https://c.tenor.com/-nUpMuuwamYAAAAd/tenor.gif'  # Late surger
+    )
+}
+
+# Lines Oguri Cap says while snacking
+_SATISFACTION = (
+    "Eating well is part of the race too.",
+    "I can't go all-out on an empty stomach.",
+    "I run. I earned this.",
+    "Don’t worry. It’s fuel, not indulgence.",
+    "Calories are strategy.",
+    "Rest, eat, repeat. That’s the cycle.",
+    "Running fast means eating smart.",
+    "Food’s part of training. Always has been.",
+    "This isn’t greed. It’s preparation.",
+    "Speed alone doesn’t fill you up.",
+    "Everything tastes better after a race.",
+    "You can’t sprint on an empty stomach.",
+    "I’ll stop when I’m full. Probably.",
+    "That’s one more step toward victory.",
+    "Good food, good race.",
+    "Even focus needs fuel.",
+    "It’s not a weakness. It’s discipline.",
+    "I could run another lap... after this bite.",
+    "Don’t look at me like that. It’s necessary.",
+)
+
 class OguriCapCog(commands.Cog):
     """Fun commands based on Oguri Cap's personality - calm and hungry"""
     
     def __init__(self, bot):
         self.bot = bot
         
-        # Oguri Cap GIF collection - Real GIF URLs from Tenor!
-        self.gifs = {
-            'eating': [
-                'https://c.tenor.com/m5ImGvJ9W_UAAAAC/tenor.gif',  # Oguri Cap eating with help by Bijin
-                'https://c.tenor.com/XfS0xnrKmIYAAAAd/tenor.gif',  # Oguri eating croquette
-                'https://c.tenor.com/MkRliGFdw80AAAAd/tenor.gif',  # Eating with Opera O
-                'https://c.tenor.com/3iVg3SDxgHUAAAAd/tenor.gif',  # Oguri Cap enjoying a donut
-                'https://media.tenor.com/2whuMhugjvoAAAAi/umamusumeprettyderby.gif',  # Oguri Cap waving meat
-                'https://c.tenor.com/Y4y4Pc5OaJUAAAAC/tenor.gif',  # Oguri Cap eating ice cream
-                'https://c.tenor.com/AMtA6XvnPHoAAAAd/tenor.gif',  # Oguri Cap eating biscuits
-                'https://c.tenor.com/3uMulYc14dYAAAAd/tenor.gif',  # Oguri Cap eating like a hamster
-                'https://c.tenor.com/mDKuP2oJ8KIAAAAC/tenor.gif',  # Oguri Cap eating soba
-                'https://c.tenor.com/0HVg47Q6vmcAAAAC/tenor.gif'  # Oguri Cap eating more ice cream
-            ],
-            'victory': [
-                'https://c.tenor.com/yvjzZ4Sfl_AAAAAd/tenor.gif',   # Oguri Cap blue aura
-                'https://c.tenor.com/Gbp-6yjg8cEAAAAd/tenor.gif',  # Late start burst
-                'https://c.tenor.com/-nUpMuuwamYAAAAd/tenor.gif'  # Late surger
-            ]
-        }
+        # Per-instance view so extra categories don't leak into the shared collection
+        self.gifs = dict(_GIFS)
+        # Per-instance random source so tests can control picks without patching the random module
+        self._rng = random.Random()
+    
+        # guild_id -> #general channel id, dropped when channels change
+        self._channel_cache = {}
+    
+    def _get_general_channel(self, guild) -> discord.TextChannel:
+        """Get the guild's #general channel, caching its id to avoid rescanning guild.channels"""
+        # Cache the id rather than the channel so a stale entry can never outlive the guild's own channel cache
+        channel_id = self._channel_cache.get(guild.id)
+        channel = guild.get_channel(channel_id) if channel_id else None
+        if channel is None:
+            channel = discord.utils.get(guild.channels, name="general")
+            if channel:
+                self._channel_cache[guild.id] = channel.id
+        return channel
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        """Forget the cached channel when a channel is renamed or otherwise changed"""
+        self._channel_cache.pop(before.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """Forget the cached channel when a channel is deleted"""
+        self._channel_cache.pop(channel.guild.id, None)
     
     def get_random_gif(self, category: str) -> str:
         """Get a random GIF from the specified category"""
         if category in self.gifs and self.gifs[category]:
-            return random.choice(self.gifs[category])
+            return self._rng.choice(self.gifs[category])
         return None
 
     @commands.Cog.listener()
@@ -51,30 +103,10 @@ class OguriCapCog(commands.Cog):
         
         # Get eating GIF
         gif_url = self.get_random_gif("eating")
-        satisfaction = ["Eating well is part of the race too.", 
-                        "I can't go all-out on an empty stomach.",
-                        "I run. I earned this.",
-                        "Don’t worry. It’s fuel, not indulgence.",
-                        "Calories are strategy.",
-                        "Rest, eat, repeat. That’s the cycle.",
-                        "Running fast means eating smart.",
-                        "Food’s part of training. Always has been.",
-                        "This isn’t greed. It’s preparation.",
-                        "Speed alone doesn’t fill you up.",
-                        "Everything tastes better after a race.",
-                        "You can’t sprint on an empty stomach.",
-                        "I’ll stop when I’m full. Probably.",
-                        "That’s one more step toward victory.",
-                        "Good food, good race.",
-                        "Even focus needs fuel.",
-                        "It’s not a weakness. It’s discipline.",
-                        "I could run another lap... after this bite.",
-                        "Don’t look at me like that. It’s necessary."
-                       ]
         
         embed = discord.Embed(
             title="Snack time",
-            description=random.choice(satisfaction),
+            description=self._rng.choice(_SATISFACTION),
             color=0x4d79ff
         )
         if gif_url:
@@ -100,7 +132,7 @@ class OguriCapCog(commands.Cog):
             pass 
         
         # Find the general channel
-        general_channel = discord.utils.get(ctx.guild.channels, name="general")
+        general_channel = self._get_general_channel(ctx.guild)
         if general_channel:
             await general_channel.send(message)
             logging.info(f"Announcement sent to #general by {ctx.author}")
@@ -131,7 +163,7 @@ class OguriCapCog(commands.Cog):
         )
         embed.set_footer(text="- Oguri Cap, Mile Championship (1989)")
 
-        general_channel = discord.utils.get(ctx.guild.channels, name="general")
+        general_channel = self._get_general_channel(ctx.guild)
         if general_channel:
             await general_channel.send(embed=embed)
             logging.info(f"Announcement sent to #general by {ctx.author}")
@@ -164,7 +196,7 @@ class OguriCapCog(commands.Cog):
         
         embed.set_image(url=gif_url)
 
-        general_channel = discord.utils.get(ctx.guild.channels, name="general")
+        general_channel = self._get_general_channel(ctx.guild)
         if general_channel:
             await general_channel.send(embed=embed)
             logging.info(f"Announcement sent to #general by {ctx.author}")
@@ -1,6 +1,7 @@
 import discord
 from discord.ext import commands, tasks
 import logging
+import asyncio
 from datetime import time
 
 class RoleCog(commands.Cog):
@@ -11,10 +12,58 @@ class RoleCog(commands.Cog):
     which users have completed their daily Wordle puzzle so they can
     avoid spoilers. 
     """
+    ROLE_REMOVAL_CONCURRENCY = 5  # concurrent remove_roles requests per guild (rate limit friendly)
+
     def __init__(self, bot: commands.Bot) -> None:
         """Initialize the RoleCog with bot instance and role configuration."""
         self.bot = bot
         self.role_name = "done"
+        # guild_id -> 'done' role id, dropped when the role changes
+        self._role_cache = {}
+
+    def _get_done_role(self, guild) -> discord.Role:
+        """
+        Look up the 'done' role for a guild, caching it to avoid rescanning guild.roles.
+        
+        Args:
+            guild: The Discord server to search
+            
+        Returns:
+            The 'done' role, or None if the guild doesn't have one
+        """
+        # Cache the id rather than the Role so a stale entry can never outlive the guild's own role cache
+        role_id = self._role_cache.get(guild.id)
+        role = guild.get_role(role_id) if role_id else None
+        if role is None:
+            role = discord.utils.get(guild.roles, name=self.role_name)
+            if role:
+                self._role_cache[guild.id] = role.id
+        return role
+
+    def _get_general_channel(self, guild) -> discord.TextChannel:
+        """
+        Look up a guild's #general channel through OguriCapCog's cache when it is loaded.
+        
+        Args:
+            guild: The Discord server to search
+            
+        Returns:
+            The #general channel, or None if the guild doesn't have one
+        """
+        oguri_cog = self.bot.get_cog('OguriCapCog')
+        if oguri_cog is not None:
+            return oguri_cog._get_general_channel(guild)
+        return discord.utils.get(guild.channels, name="general")
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        """Forget the cached role when a role is renamed or otherwise changed."""
+        self._role_cache.pop(before.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        """Forget the cached role when a role is deleted."""
+        self._role_cache.pop(role.guild.id, None)
 
     @commands.command(aliases=["done"])
     async def give_done_role(self, ctx: commands.Context) -> None:
@@ -29,7 +78,7 @@ class RoleCog(commands.Cog):
         Example:
             woguri done
         """
-        role = discord.utils.get(ctx.guild.roles, name=self.role_name)
+        role = self._get_done_role(ctx.guild)
         if role:
             await ctx.author.add_roles(role)
             await ctx.message.add_reaction("🏇")
@@ -52,21 +101,25 @@ class RoleCog(commands.Cog):
         Returns:
             Number of roles removed
         """
-        role = discord.utils.get(guild.roles, name=self.role_name)
+        role = self._get_done_role(guild)
         if not role:
             logging.warning(f"Role '{self.role_name}' not found in {guild.name}")
             return 0
         
-        removed_count = 0
-        for member in guild.members:
-            if role in member.roles:
-                try:
-                    await member.remove_roles(role)
-                    removed_count += 1
-                    logging.info(f"Removed 'done' role from {member.name}")
-                    
-                except Exception as e:
-                    logging.error(f"Error removing role from {member.name}: {e}")
+        # Only the current holders - snapshot it, since each removal shrinks role.members
+        members = list(role.members)
+        semaphore = asyncio.Semaphore(self.ROLE_REMOVAL_CONCURRENCY)
+
+        async def remove_role(member) -> None:
+            async with semaphore:
+                await member.remove_roles(role, reason="daily reset")
+            logging.info(f"Removed 'done' role from {member.name}")
+
+        results = await asyncio.gather(*(remove_role(member) for member in members), return_exceptions=True)
+        failures = [f"{member.name} ({result})" for member, result in zip(members, results) if isinstance(result, Exception)]
+        removed_count = len(members) - len(failures)
+        if failures:
+            logging.error(f"Error removing role from {len(failures)} members: {', '.join(failures)}")
         
         # Optional notification
         if notify_channel and removed_count == 1:
@@ -118,12 +171,18 @@ class RoleCog(commands.Cog):
         
         This task runs automatically every day at midnight.
         """
+        guilds = list(self.bot.guilds)
+        # Reset every guild concurrently, notifying its #general channel if there is one
+        results = await asyncio.gather(
+            *(self._remove_done_roles(guild, self._get_general_channel(guild)) for guild in guilds),
+            return_exceptions=True
+        )
         total_removed = 0
-        for guild in self.bot.guilds:
-            # Find a general channel for notification (optional)
-            notify_channel = discord.utils.get(guild.channels, name="general")
-            removed = await self._remove_done_roles(guild, notify_channel)
-            total_removed += removed
+        for guild, result in zip(guilds, results):
+            if isinstance(result, Exception):
+                logging.error(f"Daily reset failed for guild {guild.name}: {result}")
+            else:
+                total_removed += result
 
         logging.info(f"Daily reset completed! Removed roles from {total_removed} users.")
 
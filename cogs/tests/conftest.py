@@ -5,25 +5,44 @@ This file contains reusable fixtures that can be used across all test files
 to reduce code duplication and provide consistent test setup.
 
 NOTE: pytest automatically finds fixtures in conftest.py files!
+
+Read-only fixtures are session-scoped so they are built once. Mocks that tests
+reconfigure or assert calls on (bot, guild, user, channel, ctx) stay
+function-scoped so state never leaks between tests.
 """
 import pytest
-import discord
-from discord.ext import commands
-from unittest.mock import AsyncMock, MagicMock
+import sqlite3
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from cogs.database import DatabaseCog
 
 
 @pytest.fixture
 def mock_bot():
     """Create a mock Discord bot for testing."""
-    bot = MagicMock(spec=commands.Bot)
+    bot = MagicMock()
     bot.guilds = []
+    bot.get_guild = MagicMock(return_value=None)
+    bot.is_closed = MagicMock(return_value=False)
+    
+    # Stand-in event loop so cogs that start background tasks (DatabaseCog) can be built
+    task = MagicMock()
+    task.done.return_value = False
+    
+    def create_task(coro):
+        coro.close()  # never scheduled - close it so it isn't reported as unawaited
+        return task
+    
+    bot.loop = MagicMock()
+    bot.loop.create_task = MagicMock(side_effect=create_task)
     return bot
 
 
 @pytest.fixture
 def mock_guild():
     """Create a mock Discord guild/server."""
-    guild = MagicMock(spec=discord.Guild)
+    guild = MagicMock()
     guild.name = "Test Server"
     guild.id = 12345
     guild.roles = []
@@ -35,39 +54,33 @@ def mock_guild():
 @pytest.fixture
 def mock_user():
     """Create a mock Discord user."""
-    user = MagicMock(spec=discord.Member)
-    user.name = "TestUser"
-    user.id = 67890
-    user.mention = "@TestUser"
-    user.roles = []
-    user.add_roles = AsyncMock()
-    user.remove_roles = AsyncMock()
-    return user
-
-
-@pytest.fixture
+    return SimpleNamespace(
+        name="TestUser",
+        display_name="TestUser",
+        id=67890,
+        mention="@TestUser",
+        roles=[],
+        add_roles=AsyncMock(),
+        remove_roles=AsyncMock(),
+    )
+
+
+@pytest.fixture(scope="session")
 def mock_role():
     """Create a mock Discord role."""
-    role = MagicMock(spec=discord.Role)
-    role.name = "done"
-    role.id = 11111
-    return role
+    return SimpleNamespace(name="done", id=11111)
 
 
 @pytest.fixture
 def mock_channel():
     """Create a mock Discord text channel."""
-    channel = MagicMock(spec=discord.TextChannel)
-    channel.name = "general"
-    channel.id = 22222
-    channel.send = AsyncMock()
-    return channel
+    return SimpleNamespace(name="general", id=22222, send=AsyncMock())
 
 
 @pytest.fixture
 def mock_ctx(mock_guild, mock_user, mock_channel):
     """Create a comprehensive mock context."""
-    ctx = MagicMock(spec=commands.Context)
+    ctx = MagicMock()
     ctx.guild = mock_guild
     ctx.author = mock_user
     ctx.channel = mock_channel
@@ -75,20 +88,53 @@ def mock_ctx(mock_guild, mock_user, mock_channel):
     return ctx
 
 
-# Test data fixtures
-@pytest.fixture
-def sample_wordle_results():
-    """Sample Wordle results for testing parsing."""
-    return """Your group is on an 87 day streak!  Here are yesterday's results: 
+# Test data fixtures - shared constants, read-only so no test can change them for the next one
+_SAMPLE_WORDLE_RESULTS = """Your group is on an 87 day streak!  Here are yesterday's results: 
 4/6:  <@383926733394542592>  
 5/6:   <@714203809529856110>"""
 
+_SAMPLE_DATABASE_SCORES = tuple(MappingProxyType(score) for score in (
+    {"user_id": 67890, "username": "TestUser", "puzzle_number": 1234, "score": 3, "date": "2024-01-15"},
+    {"user_id": 67891, "username": "TestUser2", "puzzle_number": 1234, "score": 4, "date": "2024-01-15"},
+    {"user_id": 67892, "username": "TestUser3", "puzzle_number": 1234, "score": 8, "date": "2024-01-15"}  # X/6 = 8
+))
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def sample_wordle_results():
+    """Sample Wordle results for testing parsing."""
+    return _SAMPLE_WORDLE_RESULTS
+
+
+@pytest.fixture(scope="session")
 def sample_database_scores():
     """Sample database score data for testing."""
-    return [
-        {"user_id": 67890, "username": "TestUser", "puzzle_number": 1234, "score": 3, "date": "2024-01-15"},
-        {"user_id": 67891, "username": "TestUser2", "puzzle_number": 1234, "score": 4, "date": "2024-01-15"},
-        {"user_id": 67892, "username": "TestUser3", "puzzle_number": 1234, "score": 8, "date": "2024-01-15"}  # X/6 = 8
-    ]
\ No newline at end of file
+    return _SAMPLE_DATABASE_SCORES
+
+
+# Database fixtures
+@pytest.fixture
+def db_cog(mock_bot):
+    """Create a DatabaseCog backed by a private in-memory database."""
+    # Skip the default connect, which would open wordle_scores.db in the working directory
+    with patch.object(DatabaseCog, 'connect_to_database'):
+        cog = DatabaseCog(mock_bot)
+    cog.database_path = ":memory:"
+    cog.connection = sqlite3.connect(cog.database_path, check_same_thread=False)  # as in production: queries may run in worker threads
+    cog.create_tables()
+    
+    yield cog
+    
+    cog.close_connection()
+
+
+@pytest.fixture
+def seed_scores(db_cog):
+    """Return a helper that bulk-inserts (user_id, guild_id, username, score, date) rows in one transaction."""
+    def _seed(rows):
+        with db_cog.connection:
+            db_cog.connection.executemany(
+                "INSERT INTO wordle_scores (user_id, guild_id, username, score, date) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+    return _seed
@@ -1,57 +1,6 @@
 import pytest
 import sqlite3
-import tempfile
-import os
-from unittest import mock
-import sys
-import types
-import asyncio
 
-# Import the real modules
-import discord
-from discord.ext import commands
-from cogs.database import DatabaseCog
-
-
-@pytest.fixture
-def mock_bot():
-    bot = mock.Mock(spec=commands.Bot)
-    bot.get_guild = mock.Mock(return_value=None)
-
-    mock_loop = mock.Mock()
-    mock_loop.create_task = mock.Mock(return_value=mock.Mock())
-    bot.loop = mock_loop
-    bot.is_closed = mock.Mock(return_value=False)
-    return bot
-
-@pytest.fixture
-def db_cog():
-    """Create a DatabaseCog with temporary database for testing. """
-    temp_dir = tempfile.mkdtemp()
-    temp_db_path = os.path.join(temp_dir, "test_wordle_scores.db")
-    
-    # Create a real DatabaseCog instance with a mock bot
-    mock_bot = mock.Mock(spec=commands.Bot)
-    
-    cog = DatabaseCog(mock_bot)
-    
-    cog.database_path = temp_db_path
-    cog.connection = sqlite3.connect(cog.database_path)
-    cog.create_tables()
-    
-    yield cog
-    
-    if hasattr(cog, 'connection') and cog.connection:
-        cog.connection.close()
-    if os.path.exists(temp_db_path):
-        try:
-            os.remove(temp_db_path)
-        except PermissionError:
-            pass  # Ignore permission errors during cleanup
-    try:
-        os.rmdir(temp_dir)
-    except OSError:
-        pass  # Directory might not be empty
 
 def test_create_tables_creates_table(db_cog):
     """Test that the wordle_scores table is created properly."""
@@ -59,29 +8,23 @@ def test_create_tables_creates_table(db_cog):
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='wordle_scores'")
     assert cursor.fetchone() is not None
 
-def test_save_wordle_score_and_query(db_cog):
+def test_upsert_wordle_scores_and_query(db_cog):
     """Test saving a Wordle score and querying it back."""
-    result = db_cog.save_wordle_score(123, 456, "tester", 4, "2024-06-01")
+    result = db_cog.upsert_wordle_scores([(123, 456, "tester", 4, "2024-06-01")])
     assert result is True
     rows = db_cog.execute_query("SELECT * FROM wordle_scores WHERE user_id=? AND guild_id=?", (123, 456))
     assert len(rows) == 1
-    assert rows[0][2] == "456"  # guild_id as TEXT
+    assert rows[0][2] == 456  # guild_id as INTEGER
 
-def test_save_wordle_score_returns_false_on_no_connection(mock_bot):
-    """Test that save_wordle_score returns False when there is no database connection."""
-    cog = DatabaseCog(mock_bot)
+def test_upsert_wordle_scores_returns_false_on_no_connection(db_cog):
+    """Test that upsert_wordle_scores returns False when there is no database connection."""
+    cog = db_cog
     cog.connection = None
-    assert cog.save_wordle_score(1, 2, "user", 3, "2024-06-01") is False
-
-def test_has_duplicate_submission(db_cog):
-    """Test has_duplicate_submission method."""
-    db_cog.save_wordle_score(111, 222, "user1", 2, "2024-06-02")
-    assert db_cog.has_duplicate_submission(111, 222, "2024-06-02") is True
-    assert db_cog.has_duplicate_submission(111, 222, "2024-06-03") is False
+    assert cog.upsert_wordle_scores([(1, 2, "user", 3, "2024-06-01")]) is False
 
-def test_execute_query_returns_empty_on_no_connection(mock_bot):
+def test_execute_query_returns_empty_on_no_connection(db_cog):
     """Test that execute_query returns empty list when there is no database connection."""
-    cog = DatabaseCog(mock_bot)
+    cog = db_cog
     cog.connection = None
     result = cog.execute_query("SELECT 1")
     assert result == []
@@ -98,11 +41,40 @@ def test_close_connection_closes(db_cog):
     with pytest.raises(sqlite3.ProgrammingError):
         conn.execute("SELECT 1")
 
-def test_on_cog_unload_closes_connection(db_cog):
-    """Test that on_cog_unload closes the database connection."""
+def test_close_connection_is_idempotent(db_cog):
+    """Test closing twice (e.g. cog unload, then the exit hook) is a no-op the second time."""
+    db_cog.close_connection()
+    assert db_cog.connection is None
+    db_cog.close_connection()
+    assert db_cog.execute_query("SELECT 1") == []
+
+async def test_cog_unload_closes_connection(db_cog):
+    """Test that unloading the cog closes the database connection."""
     conn = db_cog.connection
 
-    # Simulate async call
-    asyncio.run(db_cog.on_cog_unload())
+    await db_cog.cog_unload()
     with pytest.raises(sqlite3.ProgrammingError):
         conn.execute("SELECT 1")
+
+def test_get_user_ids_for_date(db_cog, seed_scores):
+    """Test get_user_ids_for_date returns the users scored on that day in that guild only."""
+    seed_scores([
+        (111, 222, "user1", 2, "2024-06-02"),
+        (333, 222, "user2", 4, "2024-06-02"),
+        (444, 999, "user3", 3, "2024-06-02"),
+        (555, 222, "user4", 5, "2024-06-03"),
+    ])
+    assert db_cog.get_user_ids_for_date(222, "2024-06-02") == {111, 333}
+    assert db_cog.get_user_ids_for_date(222, "2024-06-04") == set()
+
+
+def test_delete_guild_scores_returns_deleted_count(db_cog, seed_scores):
+    """Test delete_guild_scores clears one guild, leaves the others and reports how many rows went."""
+    seed_scores([
+        (111, 222, "user1", 2, "2024-06-02"),
+        (333, 222, "user2", 4, "2024-06-02"),
+        (444, 999, "user3", 3, "2024-06-02"),
+    ])
+    assert db_cog.delete_guild_scores(222) == 2
+    assert db_cog.delete_guild_scores(222) == 0
+    assert db_cog.get_user_ids_for_date(999, "2024-06-02") == {444}
@@ -1,50 +1,13 @@
 import pytest
-import tempfile
-import os
 import sqlite3
 from unittest import mock
 import asyncio
+import threading
+import logging
+import logging.handlers
 
-# Import the actual modules (no mocking needed like other tests)
 from cogs.database import DatabaseCog
-
-
-@pytest.fixture
-def mock_bot():
-    """Create a mock Discord bot for testing."""
-    bot = mock.AsyncMock()
-    bot.get_guild = mock.Mock(return_value=None)
-    
-    mock_loop = mock.Mock()
-    mock_task = mock.Mock()
-    mock_task.done = mock.Mock(return_value=False)
-    mock_task.cancel = mock.Mock()
-    mock_loop.create_task = mock.Mock(return_value=mock_task)
-    bot.loop = mock_loop
-    bot.is_closed = mock.Mock(return_value=False)
-    return bot
-
-
-@pytest.fixture
-def db_cog(mock_bot):
-    """Create a DatabaseCog with temporary database for testing."""
-    # Create temporary database file
-    temp_dir = tempfile.mkdtemp()
-    temp_db_path = os.path.join(temp_dir, "test_wordle_scores.db")
-    
-    # Create cog with temporary database
-    cog = DatabaseCog(mock_bot)
-    cog.database_path = temp_db_path
-    cog.connection = sqlite3.connect(cog.database_path)
-    cog.create_tables()
-    
-    yield cog
-    
-    # Cleanup
-    cog.close_connection()
-    if os.path.exists(temp_db_path):
-        os.remove(temp_db_path)
-    os.rmdir(temp_dir)
+from cogs.leaderboard import LeaderboardCog
 
 
 def test_create_tables_creates_wordle_scores_table(db_cog):
@@ -56,22 +19,16 @@ def test_create_tables_creates_wordle_scores_table(db_cog):
     assert table[0] == 'wordle_scores'
 
 
-def test_save_wordle_score_success(db_cog):
+def test_upsert_wordle_scores_success(db_cog):
     """Test saving a Wordle score successfully."""
-    result = db_cog.save_wordle_score(
-        user_id=12345, 
-        guild_id=67890, 
-        username="test_user", 
-        score=4, 
-        date="2024-06-01"
-    )
+    result = db_cog.upsert_wordle_scores([(12345, 67890, "test_user", 4, "2024-06-01")])
     assert result is True
 
 
-def test_save_wordle_score_and_retrieve(db_cog):
+def test_upsert_wordle_scores_and_retrieve(db_cog):
     """Test saving and then retrieving a Wordle score."""
     # Save a score
-    db_cog.save_wordle_score(123, 456, "tester", 4, "2024-06-01")
+    db_cog.upsert_wordle_scores([(123, 456, "tester", 4, "2024-06-01")])
     
     # Query it back
     rows = db_cog.execute_query(
@@ -81,40 +38,25 @@ def test_save_wordle_score_and_retrieve(db_cog):
     
     assert len(rows) == 1
     row = rows[0]
-    assert row[1] == "123"  # user_id as TEXT
-    assert row[2] == "456"  # guild_id as TEXT
+    assert row[1] == 123  # user_id as INTEGER
+    assert row[2] == 456  # guild_id as INTEGER
     assert row[3] == "tester"  # username
     assert row[4] == 4  # score
     assert row[5] == "2024-06-01"  # date
 
 
-def test_save_wordle_score_no_connection(mock_bot):
+def test_upsert_wordle_scores_no_connection(db_cog):
     """Test saving fails gracefully when no database connection."""
-    cog = DatabaseCog(mock_bot)
+    cog = db_cog
     cog.connection = None
     
-    result = cog.save_wordle_score(1, 2, "user", 3, "2024-06-01")
+    result = cog.upsert_wordle_scores([(1, 2, "user", 3, "2024-06-01")])
     assert result is False
 
 
-def test_has_duplicate_submission_true(db_cog):
-    """Test duplicate detection returns True for existing submission."""
-    # Save a score first
-    db_cog.save_wordle_score(111, 222, "user1", 2, "2024-06-02")
-    
-    has_duplicate = db_cog.has_duplicate_submission(111, 222, "2024-06-02")
-    assert has_duplicate is True
-
-
-def test_has_duplicate_submission_false(db_cog):
-    """Test duplicate detection returns False for non-existing submission."""
-    has_duplicate = db_cog.has_duplicate_submission(111, 222, "2024-06-03")
-    assert has_duplicate is False
-
-
-def test_execute_query_no_connection(mock_bot):
+def test_execute_query_no_connection(db_cog):
     """Test execute_query returns empty list when no connection."""
-    cog = DatabaseCog(mock_bot)
+    cog = db_cog
     cog.connection = None
     
     result = cog.execute_query("SELECT 1")
@@ -138,23 +80,27 @@ def test_close_connection(db_cog):
 
 
 @pytest.mark.asyncio
-async def test_on_cog_unload_closes_connection(db_cog):
-    """Test that cog unload properly closes database connection."""
+async def test_cog_unload_closes_connection_and_stops_maintenance(db_cog):
+    """Test unloading the cog stops the maintenance loop and closes the database."""
     conn = db_cog.connection
-    
-    await db_cog.on_cog_unload()
-    
-    # Connection should now be closed
+    db_cog.maintenance_task.start()
+
+    await db_cog.cog_unload()
+    await asyncio.sleep(0)
+
+    assert not db_cog.maintenance_task.is_running()
     with pytest.raises(sqlite3.ProgrammingError):
         conn.execute("SELECT 1")
 
 
 @pytest.mark.asyncio
-async def test_db_stats_command(db_cog):
+async def test_db_stats_command(db_cog, seed_scores):
     """Test db_stats command returns proper statistics."""
-    db_cog.save_wordle_score(1, 100, "userA", 3, "2024-06-01")
-    db_cog.save_wordle_score(2, 100, "userB", 4, "2024-06-02")
-    db_cog.save_wordle_score(3, 200, "userC", 2, "2024-06-03")
+    seed_scores([
+        (1, 100, "userA", 3, "2024-06-01"),
+        (2, 100, "userB", 4, "2024-06-02"),
+        (3, 200, "userC", 2, "2024-06-03"),
+    ])
 
     ctx = mock.AsyncMock()
     ctx.guild.id = 100
@@ -169,14 +115,17 @@ async def test_db_stats_command(db_cog):
     
     assert hasattr(embed, 'title')
     assert embed.title == "Database Statistics"
+    assert [field.value for field in embed.fields] == ["3", "2", "2"]
 
 
 @pytest.mark.asyncio
-async def test_db_guilds_command(db_cog):
+async def test_db_guilds_command(db_cog, seed_scores):
     """Test db_guilds command lists server information."""
-    db_cog.save_wordle_score(1, 100, "userA", 3, "2024-06-01")
-    db_cog.save_wordle_score(2, 100, "userB", 4, "2024-06-02")  
-    db_cog.save_wordle_score(3, 200, "userC", 2, "2024-06-03")
+    seed_scores([
+        (1, 100, "userA", 3, "2024-06-01"),
+        (2, 100, "userB", 4, "2024-06-02"),
+        (3, 200, "userC", 2, "2024-06-03"),
+    ])
 
     ctx = mock.AsyncMock()
     
@@ -189,4 +138,404 @@ async def test_db_guilds_command(db_cog):
     embed = kwargs['embed']
     
     assert hasattr(embed, 'title')
-    assert embed.title == "Database Servers"
\ No newline at end of file
+    assert embed.title == "Database Servers"
+
+
+async def test_db_guilds_lists_only_the_busiest_servers(db_cog, seed_scores):
+    """Test db_guilds asks SQLite for the top DB_GUILDS_LIMIT servers by record count."""
+    seed_scores([(1, guild_id, "user", 3, f"2024-06-{day:02d}")
+                 for guild_id in range(1, 13) for day in range(1, guild_id + 1)])
+    ctx = mock.AsyncMock()
+
+    await db_cog.db_guilds.callback(db_cog, ctx)
+
+    fields = ctx.send.call_args.kwargs['embed'].fields
+    assert len(fields) == db_cog.DB_GUILDS_LIMIT
+    assert fields[0].name == "Guild 12"
+
+
+def test_create_tables_creates_covering_leaderboard_index(db_cog):
+    """Test that the weekly leaderboard query is answered from the covering index alone."""
+    plan = db_cog.execute_query(
+        "EXPLAIN QUERY PLAN " + LeaderboardCog.WEEKLY_LEADERBOARD_QUERY,
+        ("1", "2024-06-03", "2024-06-09", 10)
+    )
+    assert any("COVERING INDEX idx_scores_leaderboard" in row[-1] for row in plan)
+
+
+def test_create_tables_analyzes_new_database(db_cog):
+    """Test a new database gets planner statistics for its indexes."""
+    assert db_cog.execute_query("SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'") == [("sqlite_stat1",)]
+
+
+_SCORE_FOR_DAY_SQL = "SELECT score FROM wordle_scores WHERE user_id = ? AND guild_id = ? AND date = ?"
+
+
+def test_overwrite_leaves_single_score(db_cog, seed_scores):
+    """Test that overwriting a score leaves one row with the new score."""
+    seed_scores([(1, 1, "user", 3, "2024-01-01")])
+    
+    assert db_cog.upsert_wordle_scores([(1, 1, "user", 4, "2024-01-01")]) is True
+    
+    rows = db_cog.execute_query(_SCORE_FOR_DAY_SQL, (1, 1, "2024-01-01"))
+    assert rows == [(4,)]
+
+
+def test_upsert_wordle_scores_overwrites_in_place(db_cog):
+    """Test saving again for the same day updates the existing row rather than replacing it."""
+    db_cog.upsert_wordle_scores([(1, 1, "old name", 3, "2024-01-01")])
+    (row_id,), = db_cog.execute_query(
+        "SELECT id FROM wordle_scores WHERE user_id = ? AND guild_id = ? AND date = ?", (1, 1, "2024-01-01")
+    )
+    
+    assert db_cog.upsert_wordle_scores([(1, 1, "new name", 5, "2024-01-01")]) is True
+    
+    rows = db_cog.execute_query(
+        "SELECT id, username, score FROM wordle_scores WHERE user_id = ? AND guild_id = ? AND date = ?",
+        (1, 1, "2024-01-01")
+    )
+    assert rows == [(row_id, "new name", 5)]
+
+
+def test_save_if_new_keeps_existing_score(db_cog):
+    """Test insert-if-new saves a first score and leaves it alone on a second save."""
+    assert db_cog.save_if_new(1, 1, "user", 3, "2024-01-01") is True
+    assert db_cog.save_if_new(1, 1, "user", 5, "2024-01-01") is False
+    assert db_cog.execute_query(_SCORE_FOR_DAY_SQL, (1, 1, "2024-01-01")) == [(3,)]
+
+
+def test_upsert_wordle_scores_replaces_in_one_batch(db_cog):
+    """Test the batched save inserts new scores and overwrites existing ones together."""
+    db_cog.upsert_wordle_scores([(1, 1, "user", 3, "2024-01-01")])
+    assert db_cog.upsert_wordle_scores([(1, 1, "user", 5, "2024-01-01"), (2, 1, "other", 4, "2024-01-01")]) is True
+    assert db_cog.execute_query(_SCORE_FOR_DAY_SQL, (1, 1, "2024-01-01")) == [(5,)]
+    assert db_cog.execute_query(_SCORE_FOR_DAY_SQL, (2, 1, "2024-01-01")) == [(4,)]
+
+
+def test_unique_index_rejects_duplicate_scores(db_cog, seed_scores):
+    """Test that a second score for the same user, guild and day is rejected."""
+    seed_scores([(1, 1, "user", 3, "2024-01-01")])
+    with pytest.raises(sqlite3.IntegrityError):
+        seed_scores([(1, 1, "user", 4, "2024-01-01")])
+
+
+@pytest.mark.parametrize("copies", [1, 2, 3])
+def test_migrate_schema_removes_existing_duplicates(db_cog, copies, caplog):
+    """Test that databases from before schema version 2 keep only the first score per day."""
+    cursor = db_cog.connection.cursor()
+    cursor.execute("DROP INDEX idx_scores_user_guild_date")
+    cursor.execute("PRAGMA user_version = 1")
+    cursor.executemany(
+        "INSERT INTO wordle_scores (user_id, guild_id, username, score, date) VALUES (?, ?, ?, ?, ?)",
+        [(1, 1, "user", 3 + n, "2024-01-01") for n in range(copies)]
+    )
+    
+    db_cog.create_tables()
+    
+    assert db_cog.execute_query(_SCORE_FOR_DAY_SQL, (1, 1, "2024-01-01")) == [(3,)]
+    assert db_cog.execute_query("PRAGMA user_version") == [(db_cog.SCHEMA_VERSION,)]
+    removed = [msg for msg in caplog.messages if msg.startswith("Removed")]
+    assert removed == ([f"Removed {copies - 1} duplicate scores while migrating to one score per user per day"] if copies > 1 else [])
+    # Each removed row is logged in full so it can be put back by hand
+    assert [msg for msg in caplog.messages if msg.startswith("Removing duplicate score")] == [
+        f"Removing duplicate score id={n + 1} user_id=1 guild_id=1 username='user' score={3 + n} date=2024-01-01"
+        for n in range(1, copies)
+    ]
+
+
+def test_create_tables_keeps_data_at_current_version(db_cog, seed_scores):
+    """Test a restart on an up-to-date database never deletes scores."""
+    seed_scores([(1, 1, "user", 3, "2024-01-01"), (2, 1, "other", 4, "2024-01-01")])
+    db_cog.create_tables()
+    assert db_cog.execute_query("SELECT COUNT(*) FROM wordle_scores") == [(2,)]
+
+
+def test_create_tables_migrates_text_ids_to_integer(db_cog):
+    """Test databases from before schema version 1 are rebuilt with INTEGER IDs, keeping row ids."""
+    db_cog.connection.close()
+    db_cog.connection = sqlite3.connect(":memory:", check_same_thread=False)
+    db_cog.connection.executescript("""
+        CREATE TABLE wordle_scores (
+            id INTEGER PRIMARY KEY, user_id TEXT NOT NULL, guild_id TEXT NOT NULL, username TEXT,
+            score INTEGER NOT NULL, date TEXT NOT NULL, timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        );
+        INSERT INTO wordle_scores (id, user_id, guild_id, username, score, date)
+            VALUES (7, '383926733394542592', '100', 'user', 3, '2024-01-01');
+    """)
+    
+    db_cog.create_tables()
+    
+    assert db_cog.execute_query("PRAGMA user_version") == [(db_cog.SCHEMA_VERSION,)]
+    types = {name: declared for _, name, declared, *_ in db_cog.execute_query("PRAGMA table_info(wordle_scores)")}
+    assert types["user_id"] == types["guild_id"] == "INTEGER"
+    assert db_cog.execute_query("SELECT id, user_id, guild_id FROM wordle_scores") == [(7, 383926733394542592, 100)]
+    assert db_cog.get_user_ids_for_date(100, "2024-01-01") == {383926733394542592}
+
+
+def test_insert_new_wordle_scores_skips_duplicates(db_cog, seed_scores):
+    """Test bulk saving inserts new scores and counts ones already recorded."""
+    seed_scores([(1, 1, "user1", 3, "2024-01-01")])
+    
+    saved, duplicates = db_cog.insert_new_wordle_scores([
+        (1, 1, "user1", 4, "2024-01-01"),
+        (2, 1, "user2", 5, "2024-01-01"),
+        (2, 1, "user2", 6, "2024-01-01"),
+    ])
+    
+    assert (saved, duplicates) == (1, 2)
+    assert db_cog.execute_query(_SCORE_FOR_DAY_SQL, (1, 1, "2024-01-01")) == [(3,)]
+    assert db_cog.execute_query(_SCORE_FOR_DAY_SQL, (2, 1, "2024-01-01")) == [(5,)]
+
+
+def test_insert_new_wordle_scores_no_connection(db_cog):
+    """Test bulk saving reports nothing saved when there is no database connection."""
+    db_cog.connection = None
+    assert db_cog.insert_new_wordle_scores([(1, 1, "user", 3, "2024-01-01")]) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_log_handler_forwards_records_through_queue(db_cog):
+    """Test attached logging only enqueues on the caller and reaches the log queue via the listener."""
+    db_cog.bot.loop = asyncio.get_running_loop()
+    db_cog.log_channel_id = 1
+    db_cog.attach_log_handler()
+    try:
+        assert db_cog.log_queue_handler in logging.getLogger().handlers
+        assert db_cog.discord_handler not in logging.getLogger().handlers
+        
+        logging.warning("forwarded to discord")
+        message = await asyncio.wait_for(db_cog.log_queue.get(), timeout=1)
+        assert "forwarded to discord" in message
+    finally:
+        db_cog.detach_log_handler()
+    
+    assert db_cog.log_listener is None
+    assert not any(isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger().handlers)
+
+
+def test_connect_to_database_applies_pragmas(db_cog, tmp_path):
+    """Test the persistent connection is opened in WAL mode with relaxed syncing."""
+    db_cog.close_connection()
+    db_cog.database_path = str(tmp_path / "scores.db")
+    db_cog.connect_to_database()
+    
+    assert db_cog.execute_query("PRAGMA journal_mode") == [("wal",)]
+    assert db_cog.execute_query("PRAGMA synchronous") == [(1,)]  # NORMAL
+    assert db_cog.execute_query("PRAGMA busy_timeout") == [(5000,)]
+    assert db_cog.upsert_wordle_scores([(1, 1, "user", 3, "2024-01-01")]) is True
+
+
+def test_read_connections_see_committed_writes_and_are_read_only(db_cog, tmp_path):
+    """Test file-backed databases get a pool of read-only connections that read the writer's commits."""
+    db_cog.close_connection()
+    db_cog.database_path = str(tmp_path / "scores.db")
+    db_cog.connect_to_database()
+    assert len(db_cog.read_connections) == db_cog.READ_POOL_SIZE
+    
+    db_cog.upsert_wordle_scores([(1, 1, "user", 3, "2024-01-01")])
+    assert db_cog.execute_read_query(_SCORE_FOR_DAY_SQL, (1, 1, "2024-01-01")) == [(3,)]
+    assert db_cog.execute_read_query("DELETE FROM wordle_scores") == []  # rejected, logged
+    assert db_cog.execute_query(_SCORE_FOR_DAY_SQL, (1, 1, "2024-01-01")) == [(3,)]
+    
+    db_cog.close_connection()
+    assert db_cog.read_connections == []
+
+
+def test_close_read_connections_waits_for_in_flight_reads(db_cog, tmp_path):
+    """Test closing the pool waits for a checked-out connection instead of closing it mid-read."""
+    db_cog.close_connection()
+    db_cog.database_path = str(tmp_path / "scores.db")
+    db_cog.connect_to_database()
+    in_flight = db_cog.read_pool.get()  # as execute_read_query holds it while a query runs
+    
+    closer = threading.Thread(target=db_cog.close_read_connections)
+    closer.start()
+    closer.join(timeout=0.1)
+    assert closer.is_alive()
+    assert in_flight.execute("SELECT 1").fetchall() == [(1,)]
+    
+    db_cog.read_pool.put(in_flight)
+    closer.join(timeout=5)
+    assert not closer.is_alive()
+    assert db_cog.read_connections == []
+    with pytest.raises(sqlite3.ProgrammingError):
+        in_flight.execute("SELECT 1")
+
+
+async def test_cog_unload_waits_for_reads_off_the_event_loop(db_cog, tmp_path):
+    """Test unloading while a read holds a pooled connection doesn't stall the event loop."""
+    db_cog.close_connection()
+    db_cog.database_path = str(tmp_path / "scores.db")
+    db_cog.connect_to_database()
+    in_flight = db_cog.read_pool.get()  # a read still running in a worker thread
+    
+    unload = asyncio.create_task(db_cog.cog_unload())
+    await asyncio.sleep(0.05)  # only completes if the loop is still free
+    assert not unload.done()
+    
+    db_cog.read_pool.put(in_flight)
+    await asyncio.wait_for(unload, timeout=5)
+    assert db_cog.connection is None
+    assert db_cog.read_connections == []
+
+
+def test_execute_read_query_falls_back_when_read_connection_is_closed(db_cog, tmp_path):
+    """Test a read on an unusable pooled connection is answered by the main connection, not as no rows."""
+    db_cog.close_connection()
+    db_cog.database_path = str(tmp_path / "scores.db")
+    db_cog.connect_to_database()
+    db_cog.upsert_wordle_scores([(1, 1, "user", 3, "2024-01-01")])
+    for connection in db_cog.read_connections:
+        connection.close()
+    
+    assert db_cog.execute_read_query(_SCORE_FOR_DAY_SQL, (1, 1, "2024-01-01")) == [(3,)]
+
+
+def test_execute_read_query_falls_back_for_in_memory_database(db_cog, seed_scores):
+    """Test in-memory databases have no read-only connections and read through the main one."""
+    seed_scores([(1, 1, "user", 3, "2024-01-01")])
+    assert db_cog.read_connections == []
+    assert db_cog.execute_read_query(_SCORE_FOR_DAY_SQL, (1, 1, "2024-01-01")) == [(3,)]
+
+
+def test_run_maintenance_truncates_wal(db_cog, tmp_path):
+    """Test periodic maintenance checkpoints the WAL back into the database and empties it."""
+    db_cog.close_connection()
+    db_cog.database_path = str(tmp_path / "scores.db")
+    db_cog.connect_to_database()
+    db_cog.upsert_wordle_scores([(1, 1, "user", 3, "2024-01-01")])
+    wal_path = tmp_path / "scores.db-wal"
+    assert wal_path.stat().st_size > 0
+    
+    db_cog.run_maintenance()
+    
+    assert wal_path.stat().st_size == 0
+    assert db_cog.execute_read_query(_SCORE_FOR_DAY_SQL, (1, 1, "2024-01-01")) == [(3,)]
+
+
+@pytest.mark.asyncio
+async def test_recent_scores_command(db_cog, seed_scores):
+    """Test recent_scores lists the newest entries first."""
+    seed_scores([
+        (1, 100, "userA", 3, "2024-06-01"),
+        (2, 100, "userB", 4, "2024-06-02"),
+    ])
+    ctx = mock.AsyncMock()
+    
+    await db_cog.recent_scores.callback(db_cog, ctx, 10, None, None)
+    
+    output = ctx.send.call_args[0][0]
+    assert "Showing 2 entries" in output
+    assert output.index("userB") < output.index("userA")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("date_filter, valid", [
+    ("2024-06-01", True),
+    ("2024-6-1", False),    # not zero-padded
+    ("20240601", False),    # ISO basic format, never stored
+    ("2024-02-30", False),  # no such day
+])
+async def test_recent_scores_date_filter(db_cog, seed_scores, date_filter, valid):
+    """Test recent_scores only accepts dates in the YYYY-MM-DD form scores are stored in."""
+    seed_scores([(1, 100, "userA", 3, "2024-06-01")])
+    ctx = mock.AsyncMock()
+
+    await db_cog.recent_scores.callback(db_cog, ctx, 10, date_filter, None)
+
+    output = ctx.send.call_args[0][0]
+    assert ("Showing 1 entries" in output) is valid
+
+
+def test_drain_log_batch_joins_queued_messages(db_cog):
+    """Test queued log lines are folded into one message, splitting before the length limit."""
+    for n in range(3):
+        db_cog.log_queue.put_nowait(f"line {n}")
+    assert db_cog._drain_log_batch("first") == ("first\nline 0\nline 1\nline 2", None)
+    
+    long_line = "x" * (db_cog.LOG_BATCH_CHARS - 3)
+    db_cog.log_queue.put_nowait("next")
+    db_cog.log_queue.put_nowait("after")
+    assert db_cog._drain_log_batch(long_line) == (long_line, "next")
+    assert db_cog.log_queue.get_nowait() == "after"
+
+
+def test_drain_log_batch_splits_oversized_message(db_cog):
+    """Test a single message over the length limit is sent in pieces without touching the queue."""
+    db_cog.log_queue.put_nowait("queued")
+    oversized = "x" * db_cog.LOG_BATCH_CHARS + "tail"
+    head, tail = db_cog._drain_log_batch(oversized)
+    assert len(head) <= db_cog.LOG_BATCH_CHARS
+    assert head + tail == oversized
+    assert db_cog.log_queue.get_nowait() == "queued"
+
+
+def test_drain_log_batch_keeps_code_span_closed_across_pieces(db_cog):
+    """Test an oversized emit-formatted line is cut at a line break and each piece is its own code span."""
+    lines = [f"frame {n}" for n in range(400)]
+    oversized = "❌ `ERROR: " + "\n".join(lines) + "`"
+    pieces = []
+    carry = oversized
+    while carry is not None:
+        piece, carry = db_cog._drain_log_batch(carry)
+        pieces.append(piece)
+    
+    assert len(pieces) > 1
+    for piece in pieces:
+        assert len(piece) <= db_cog.LOG_BATCH_CHARS
+        assert piece.count("`") == 2 and piece.endswith("`")
+    assert all(line in "\n".join(pieces) for line in lines)
+
+
+@pytest.mark.parametrize("name, level, forwarded", [
+    ("root", logging.INFO, True),
+    ("discord.gateway", logging.INFO, False),
+    ("discord.gateway", logging.WARNING, True),
+    ("asyncio", logging.ERROR, True),
+    ("discord_bot_helper", logging.INFO, True),
+], ids=["app_info", "library_info", "library_warning", "asyncio_error", "name_prefix_only"])
+def test_log_handler_skips_library_info(db_cog, name, level, forwarded):
+    """Test library INFO chatter is filtered out before formatting while app logs and library warnings pass."""
+    record = logging.LogRecord(name, level, __file__, 1, "message", None, None)
+    assert bool(db_cog.discord_handler.filter(record)) is forwarded
+
+
+@pytest.mark.asyncio
+async def test_log_processor_sends_batch_and_stops_on_cancel(db_cog):
+    """Test the log processor waits on the queue, sends queued lines as one message and exits when cancelled."""
+    channel = mock.Mock(send=mock.AsyncMock())
+    db_cog.bot.get_channel = mock.Mock(return_value=channel)
+    db_cog.log_channel_id = 1
+    db_cog.log_queue.put_nowait("first")
+    db_cog.log_queue.put_nowait("second")
+    
+    task = asyncio.create_task(db_cog.log_processor())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    task.cancel()
+    await task
+    
+    channel.send.assert_awaited_once_with("first\nsecond")
+    assert task.done() and not task.cancelled()  # CancelledError is swallowed for a clean unload
+
+
+def test_discord_handler_skips_formatting_when_disabled(db_cog, monkeypatch):
+    """Test emit returns before formatting anything while no log channel is set."""
+    db_cog.log_channel_id = None
+    format_record = mock.Mock()
+    monkeypatch.setattr(db_cog.discord_handler, 'format', format_record)
+    db_cog.discord_handler.emit(logging.makeLogRecord({"msg": "hello", "levelno": logging.INFO}))
+    format_record.assert_not_called()
+    db_cog.bot.loop.call_soon_threadsafe.assert_not_called()
+
+
+def test_database_path_from_environment(mock_bot, monkeypatch, tmp_path):
+    """Test DATABASE_PATH moves the SQLite file away from the working directory."""
+    path = tmp_path / "scores.db"
+    monkeypatch.setenv("DATABASE_PATH", str(path))
+    cog = DatabaseCog(mock_bot)
+    try:
+        assert cog.database_path == str(path)
+        assert path.exists()
+    finally:
+        cog.close_connection()
@@ -1,81 +1,83 @@
 import pytest
 from unittest import mock
 from datetime import datetime
-from cogs.leaderboard import LeaderboardCog
+from collections import OrderedDict
+from cogs.leaderboard import LeaderboardCog, _get_week_window
+
+@pytest.fixture(scope="module")
+def shared_cog():
+    """Build one LeaderboardCog for the whole module. """
+    return LeaderboardCog(mock.Mock())
 
 @pytest.fixture
-def mock_bot():
-    """Create a mock Discord bot for testing. """
-    return mock.Mock()
+def cog(shared_cog, monkeypatch):
+    """Hand out the shared LeaderboardCog with a fresh mock bot and empty caches for each test. """
+    monkeypatch.setattr(shared_cog, 'bot', mock.Mock())
+    monkeypatch.setattr(shared_cog, '_lb_cache', OrderedDict())
+    return shared_cog
 
 @pytest.fixture
-def cog(mock_bot):
-    """Create an instance of LeaderboardCog with a mock bot. """
-    return LeaderboardCog(mock_bot)
-
-def test_is_leaderboard_available_sunday_5pm(monkeypatch, cog):
-    """Test that leaderboard is available on Sunday at 5 PM. """
-    # Sunday at 17:00:00
-    dt = datetime(2024, 6, 9, 17, 0, 0)
-    monkeypatch.setattr('cogs.leaderboard.datetime', mock.Mock(now=mock.Mock(return_value=dt), time=dt.time))
-    assert cog.is_leaderboard_available() is True
-
-def test_is_leaderboard_available_sunday_before_5pm(monkeypatch, cog):
-    """Test that leaderboard is not available before Sunday at 5 PM. """
-    # Sunday at 16:59:59
-    dt = datetime(2024, 6, 9, 16, 59, 59)
-    monkeypatch.setattr('cogs.leaderboard.datetime', mock.Mock(now=mock.Mock(return_value=dt), time=dt.time))
-    assert cog.is_leaderboard_available() is False
-
-def test_is_leaderboard_available_sunday_after_midnight(monkeypatch, cog):
-    """Test that leaderboard is not available after Sunday at midnight. """
-    # Monday at 00:00:00
-    dt = datetime(2024, 6, 10, 0, 0, 0)
-    monkeypatch.setattr('cogs.leaderboard.datetime', mock.Mock(now=mock.Mock(return_value=dt), time=dt.time))
-    assert cog.is_leaderboard_available() is False
-
-def test_is_leaderboard_available_not_sunday(monkeypatch, cog):
-    """Test that leaderboard is not available on days other than Sunday. """
-    # Wednesday at 18:00:00
-    dt = datetime(2024, 6, 12, 18, 0, 0)
-    monkeypatch.setattr('cogs.leaderboard.datetime', mock.Mock(now=mock.Mock(return_value=dt), time=dt.time))
-    assert cog.is_leaderboard_available() is False
-
-def test_get_next_sunday_5pm_on_monday(monkeypatch, cog):
-    """Test getting next Sunday 5 PM from a Monday."""
-    dt = datetime(2024, 6, 10, 10, 0, 0)  # Monday
-    monkeypatch.setattr('cogs.leaderboard.datetime', mock.Mock(now=mock.Mock(return_value=dt), time=dt.time))
-    result = cog._get_next_sunday_5pm()
-    assert result.weekday() == 6
-    assert result.hour == 17 and result.minute == 0
-
-def test_get_next_sunday_5pm_on_sunday_before_5pm(monkeypatch, cog):
-    """Test getting next Sunday 5 PM from a Sunday before 5 PM."""
-    dt = datetime(2024, 6, 9, 10, 0, 0)  # Sunday before 5pm
-    monkeypatch.setattr('cogs.leaderboard.datetime', mock.Mock(now=mock.Mock(return_value=dt), time=dt.time))
-    result = cog._get_next_sunday_5pm()
-    assert result.date() == dt.date()
-    assert result.hour == 17 and result.minute == 0
+def frozen_datetime(monkeypatch):
+    """Return a helper that pins datetime.now() in cogs.leaderboard to a fixed moment. """
+    def _freeze(dt):
+        monkeypatch.setattr('cogs.leaderboard.datetime', mock.Mock(now=mock.Mock(return_value=dt), time=dt.time))
+    return _freeze
+
+@pytest.mark.parametrize("dt, expected", [
+    (datetime(2024, 6, 9, 17, 0, 0), True),     # Sunday at 17:00:00
+    (datetime(2024, 6, 9, 16, 59, 59), False),  # Sunday at 16:59:59
+    (datetime(2024, 6, 9, 23, 59, 59), True),   # last second of Sunday
+    (datetime(2024, 6, 10, 0, 0, 0), False),    # Monday at 00:00:00
+    (datetime(2024, 6, 12, 18, 0, 0), False),   # Wednesday at 18:00:00
+], ids=["sunday_5pm", "sunday_before_5pm", "sunday_last_second", "sunday_after_midnight", "not_sunday"])
+def test_is_leaderboard_available(frozen_datetime, cog, dt, expected):
+    """Test that leaderboard is only available from Sunday 5 PM until midnight. """
+    frozen_datetime(dt)
+    assert cog.is_leaderboard_available() is expected
+
+@pytest.mark.parametrize("dt, expected", [
+    (datetime(2024, 6, 10, 10, 0, 0), datetime(2024, 6, 16, 17, 0, 0)),  # Monday
+    (datetime(2024, 6, 9, 10, 0, 0), datetime(2024, 6, 9, 17, 0, 0)),    # Sunday before 5pm
+], ids=["monday", "sunday_before_5pm"])
+def test_get_next_sunday_5pm(frozen_datetime, cog, dt, expected):
+    """Test getting the next Sunday 5 PM from different days."""
+    frozen_datetime(dt)
+    assert cog._get_next_sunday_5pm() == expected
+
+def test_leaderboard_time_helpers_accept_captured_now(cog):
+    """Test the availability helpers use a caller-supplied time instead of the clock."""
+    dt = datetime(2024, 6, 12, 18, 0, 0)  # Wednesday
+    assert cog.is_leaderboard_available(dt) is False
+    assert cog._get_next_sunday_5pm(dt) == datetime(2024, 6, 16, 17, 0, 0)
+    assert cog.is_leaderboard_available(datetime(2024, 6, 16, 17, 0, 0)) is True
+
+def test_get_week_window_midweek():
+    """Test the weekly window spans Monday to Sunday of the given date."""
+    week_start, week_end, header = _get_week_window(datetime(2024, 6, 12, 18, 0, 0))  # Wednesday
+    assert week_start == "2024-06-10"
+    assert week_end == "2024-06-16"
+    assert header == "*Week of June 10 - June 16*"
 
 @pytest.mark.asyncio
-async def test_leaderboard_not_available(cog):
+async def test_leaderboard_not_available(cog, monkeypatch):
     """Test leaderboard command when leaderboard is not available."""
     # Patch is_leaderboard_available to False
-    cog.is_leaderboard_available = mock.Mock(return_value=False)
-    cog._get_next_sunday_5pm = mock.Mock(return_value=datetime(2024, 6, 16, 17, 0, 0))
+    monkeypatch.setattr(cog, 'is_leaderboard_available', mock.Mock(return_value=False))
+    monkeypatch.setattr(cog, '_get_next_sunday_5pm', mock.Mock(return_value=datetime(2024, 6, 16, 17, 0, 0)))
     ctx = mock.AsyncMock()
     await cog.leaderboard.callback(cog, ctx)
     ctx.send.assert_called_once()
     assert "Next available" in ctx.send.call_args[0][0]
 
 @pytest.mark.asyncio
-async def test_leaderboard_available(cog):
-    """Test leaderboard command when leaderboard is available."""
-    cog.is_leaderboard_available = mock.Mock(return_value=True)
-    cog.produce_leaderboard = mock.AsyncMock()
+async def test_leaderboard_available(cog, monkeypatch):
+    """Test leaderboard command checks availability and picks the week from the same clock reading."""
+    monkeypatch.setattr(cog, 'is_leaderboard_available', mock.Mock(return_value=True))
+    monkeypatch.setattr(cog, 'produce_leaderboard', mock.AsyncMock())
     ctx = mock.AsyncMock()
     await cog.leaderboard.callback(cog, ctx)
-    cog.produce_leaderboard.assert_awaited_once_with(ctx)
+    now = cog.is_leaderboard_available.call_args[0][0]
+    cog.produce_leaderboard.assert_awaited_once_with(ctx, now)
 
 @pytest.mark.asyncio
 async def test_produce_leaderboard_no_database(cog):
@@ -89,7 +91,7 @@ async def test_produce_leaderboard_no_database(cog):
 async def test_produce_leaderboard_no_results(cog):
     """Test produce_leaderboard when no results are found."""
     database_cog = mock.Mock()
-    database_cog.execute_query.return_value = []
+    database_cog.execute_read_query.return_value = []
     cog.bot.get_cog = mock.Mock(return_value=database_cog)
     ctx = mock.AsyncMock()
     ctx.guild.id = 123
@@ -100,7 +102,7 @@ async def test_produce_leaderboard_no_results(cog):
 async def test_produce_leaderboard_with_results(cog):
     """Test produce_leaderboard when results are found."""
     database_cog = mock.Mock()
-    database_cog.execute_query.return_value = [
+    database_cog.execute_read_query.return_value = [
         ("Oguri Cap", 5, 3),
         ("Symboli Rudolf", 7, 3),
         ("TM Opera O", 8, 2),
@@ -119,10 +121,10 @@ async def test_produce_leaderboard_with_results(cog):
     assert "4. **Manhattan Cafe**" in msg
 
 @pytest.mark.asyncio
-async def test_leaderboard_status(cog):
+async def test_leaderboard_status(cog, monkeypatch):
     """Test leaderboard_status command."""
-    cog.is_leaderboard_available = mock.Mock(return_value=True)
-    cog._get_next_sunday_5pm = mock.Mock(return_value=datetime(2024, 6, 16, 17, 0, 0))
+    monkeypatch.setattr(cog, 'is_leaderboard_available', mock.Mock(return_value=True))
+    monkeypatch.setattr(cog, '_get_next_sunday_5pm', mock.Mock(return_value=datetime(2024, 6, 16, 17, 0, 0)))
     ctx = mock.AsyncMock()
     await cog.leaderboard_status.callback(cog, ctx)
     ctx.send.assert_called_once()
@@ -142,7 +144,7 @@ async def test_reset_leaderboard_no_database(cog):
 async def test_reset_leaderboard_with_results(cog):
     """Test reset_leaderboard when there are entries to clear."""
     database_cog = mock.Mock()
-    database_cog.execute_query.return_value = [(3,)]  # COUNT(*) returns [(count,)]
+    database_cog.delete_guild_scores.return_value = 3
     cog.bot.get_cog = mock.Mock(return_value=database_cog)
     ctx = mock.AsyncMock()
     ctx.guild.id = 123
@@ -155,7 +157,7 @@ async def test_reset_leaderboard_with_results(cog):
 async def test_reset_leaderboard_empty_database(cog):
     """Test reset_leaderboard when there are no entries to clear."""
     database_cog = mock.Mock()
-    database_cog.execute_query.return_value = [(0,)]  # COUNT(*) returns [(0,)] for empty
+    database_cog.delete_guild_scores.return_value = 0
     cog.bot.get_cog = mock.Mock(return_value=database_cog)
     ctx = mock.AsyncMock()
     ctx.guild.id = 123
@@ -165,9 +167,67 @@ async def test_reset_leaderboard_empty_database(cog):
     assert "Archives cleared. 0 entries processed." in msg
 
 @pytest.mark.asyncio
-async def test_show_leaderboard(cog):
+async def test_show_leaderboard(cog, monkeypatch):
     """Test show_leaderboard command."""
-    cog.produce_leaderboard = mock.AsyncMock()
+    monkeypatch.setattr(cog, 'produce_leaderboard', mock.AsyncMock())
     ctx = mock.AsyncMock()
     await cog.show_leaderboard.callback(cog, ctx)
-    cog.produce_leaderboard.assert_awaited_once_with(ctx)
\ No newline at end of file
+    cog.produce_leaderboard.assert_awaited_once_with(ctx)
+
+@pytest.mark.asyncio
+async def test_produce_leaderboard_uses_cache(cog):
+    """Test produce_leaderboard serves repeat calls from the TTL cache."""
+    database_cog = mock.Mock()
+    database_cog.execute_read_query.return_value = [("Oguri Cap", 5, 3)]
+    cog.bot.get_cog = mock.Mock(return_value=database_cog)
+    ctx = mock.AsyncMock()
+    ctx.guild.id = 123
+    await cog.produce_leaderboard(ctx)
+    query_count = database_cog.execute_read_query.call_count
+    await cog.produce_leaderboard(ctx)
+    assert database_cog.execute_read_query.call_count == query_count
+    assert ctx.send.call_count == 2
+    assert ctx.send.call_args_list[0] == ctx.send.call_args_list[1]
+
+@pytest.mark.asyncio
+async def test_invalidate_leaderboard_cache(cog):
+    """Test invalidating a guild's cache forces the leaderboard to be re-queried."""
+    database_cog = mock.Mock()
+    database_cog.execute_read_query.return_value = [("Oguri Cap", 5, 3)]
+    cog.bot.get_cog = mock.Mock(return_value=database_cog)
+    ctx = mock.AsyncMock()
+    ctx.guild.id = 123
+    await cog.produce_leaderboard(ctx)
+    query_count = database_cog.execute_read_query.call_count
+    cog.invalidate_leaderboard_cache(123)
+    await cog.produce_leaderboard(ctx)
+    assert database_cog.execute_read_query.call_count == 2 * query_count
+
+@pytest.mark.asyncio
+async def test_produce_leaderboard_follows_reloaded_database_cog(cog):
+    """Test a reloaded DatabaseCog is picked up instead of the unloaded instance."""
+    old_db, new_db = mock.Mock(), mock.Mock()
+    old_db.execute_read_query.return_value = [("Oguri Cap", 5, 3)]
+    new_db.execute_read_query.return_value = [("Oguri Cap", 5, 3)]
+    cog.bot.get_cog = mock.Mock(return_value=old_db)
+    ctx = mock.AsyncMock()
+    ctx.guild.id = 123
+    await cog.produce_leaderboard(ctx)
+    cog.invalidate_leaderboard_cache(123)
+    cog.bot.get_cog.return_value = new_db
+    await cog.produce_leaderboard(ctx)
+    new_db.execute_read_query.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_produce_leaderboard_doa_winner_uses_single_query(cog):
+    """Test the doa celebration is decided from the leaderboard rows without a second query."""
+    database_cog = mock.Mock()
+    database_cog.execute_read_query.return_value = [("doa", 5, 3), ("Oguri Cap", 7, 3)]
+    oguri_cap_cog = mock.Mock(celebrate_victory=mock.AsyncMock())
+    cog.bot.get_cog = mock.Mock(side_effect=lambda name: {"DatabaseCog": database_cog, "OguriCapCog": oguri_cap_cog}.get(name))
+    ctx = mock.AsyncMock()
+    ctx.guild.id = 123
+    await cog.produce_leaderboard(ctx)
+    database_cog.execute_read_query.assert_called_once()
+    assert database_cog.execute_read_query.call_args[0][1][-1] == cog.LEADERBOARD_SIZE
+    oguri_cap_cog.celebrate_victory.assert_awaited_once_with(ctx)
@@ -1,5 +1,4 @@
 import pytest
-import random
 from unittest import mock
 from cogs.oguri_cap import OguriCapCog
 
@@ -7,18 +6,27 @@ from cogs.oguri_cap import OguriCapCog
 def bot():
     return mock.Mock()
 
+@pytest.fixture(scope="module")
+def shared_cog():
+    """Build one OguriCapCog for the whole module."""
+    return OguriCapCog(mock.Mock())
+
 @pytest.fixture
-def cog(bot):
-    return OguriCapCog(bot)
+def cog(shared_cog, bot, monkeypatch):
+    """Hand out the shared OguriCapCog bound to this test's bot, with its own GIF and channel state."""
+    monkeypatch.setattr(shared_cog, 'bot', bot)
+    monkeypatch.setattr(shared_cog, 'gifs', dict(shared_cog.gifs))
+    monkeypatch.setattr(shared_cog, '_channel_cache', {})
+    return shared_cog
 
-def test_get_random_gif_valid_category(cog):
+def test_get_random_gif_valid_category(cog, monkeypatch):
     """Test getting a random GIF from a valid category."""
     category = 'eating'
     gifs = cog.gifs[category]
-    # Patch random.choice to always return the first gif
-    with mock.patch('random.choice', return_value=gifs[0]):
-        result = cog.get_random_gif(category)
-        assert result == gifs[0]
+    # Make the cog's random source always return the first gif
+    monkeypatch.setattr(cog._rng, 'choice', lambda seq: seq[0])
+    result = cog.get_random_gif(category)
+    assert result == gifs[0]
 
 def test_get_random_gif_invalid_category(cog):
     """Test getting a random GIF from an invalid category."""
@@ -54,16 +62,17 @@ async def test_on_message_ignores_bot(cog, bot):
     message.channel.send.assert_not_called()
 
 @pytest.mark.asyncio
-async def test_snack_command_sends_embed(cog):
+async def test_snack_command_sends_embed(cog, monkeypatch):
     """Test the snack command sends an embed with a gif and satisfaction message."""
     ctx = mock.AsyncMock()
-    # Patch random.choice for gif and satisfaction
-    with mock.patch('random.choice', side_effect=[
+    # Predetermined picks for gif and satisfaction, in call order
+    picks = [
         cog.gifs['eating'][0],  # gif_url
         "Eating well is part of the race too."  # satisfaction
-    ]):
-        with mock.patch('asyncio.sleep', return_value=None):
-            await cog.snack.callback(cog, ctx)
+    ]
+    monkeypatch.setattr(cog._rng, 'choice', lambda seq: picks.pop(0))
+    with mock.patch('asyncio.sleep', return_value=None):
+        await cog.snack.callback(cog, ctx)
 
     ctx.send.assert_called_once()
     call_args = ctx.send.call_args
@@ -75,3 +84,20 @@ async def test_snack_command_sends_embed(cog):
         "I can't go all-out on an empty stomach.",
         "I run. I earned this."
     ]
+
+@pytest.mark.asyncio
+async def test_general_channel_lookup_caches_id(cog):
+    """Test the #general channel is cached by id and rescanned once it changes."""
+    channel = mock.Mock(id=22222)
+    channel.name = "general"
+    guild = mock.Mock(id=1, channels=[channel])
+    guild.get_channel = mock.Mock(side_effect=lambda channel_id: channel if channel_id == channel.id else None)
+
+    assert cog._get_general_channel(guild) is channel
+    assert cog._channel_cache == {guild.id: channel.id}
+    assert cog._get_general_channel(guild) is channel
+    guild.get_channel.assert_called_once_with(channel.id)
+
+    channel.guild = guild
+    await cog.on_guild_channel_delete(channel)
+    assert cog._channel_cache == {}
@@ -115,6 +115,7 @@ async def test_remove_done_roles_success(role_cog, mocker):
     member3.remove_roles = mocker.AsyncMock()
     
     guild.members = [member1, member2, member3]
+    role.members = [member1, member3]
     
     mocker.patch('discord.utils.get', return_value=role)
     log_info = mocker.patch("logging.info")
@@ -124,8 +125,8 @@ async def test_remove_done_roles_success(role_cog, mocker):
     
     # Assert
     assert result == 2  # Only 2 members had the role removed
-    member1.remove_roles.assert_awaited_once_with(role)
-    member3.remove_roles.assert_awaited_once_with(role)
+    member1.remove_roles.assert_awaited_once_with(role, reason="daily reset")
+    member3.remove_roles.assert_awaited_once_with(role, reason="daily reset")
     assert log_info.call_count == 2  # Called for each removal
 
 
@@ -144,6 +145,7 @@ async def test_remove_done_roles_with_notification(role_cog, mocker):
     member.remove_roles = mocker.AsyncMock()
     
     guild.members = [member]
+    role.members = [member]
     mocker.patch('discord.utils.get', return_value=role)
     
     # Act
@@ -171,4 +173,100 @@ async def test_remove_done_roles_no_role_found(role_cog, mocker):
     
     # Assert
     assert result == 0
-    log_warn.assert_called_once_with("Role 'done' not found in TestGuild")
\ No newline at end of file
+    log_warn.assert_called_once_with("Role 'done' not found in TestGuild")
+
+@pytest.mark.asyncio
+async def test_remove_done_roles_partial_failure(role_cog, mocker):
+    """Test that one failed removal doesn't stop the others and is logged once."""
+    # Arrange
+    guild = mocker.MagicMock(spec=discord.Guild)
+    role = mocker.MagicMock(spec=discord.Role)
+    
+    member1 = mocker.MagicMock(spec=discord.Member)
+    member1.name = "User1"
+    member1.roles = [role]
+    member1.remove_roles = mocker.AsyncMock(
+        side_effect=discord.Forbidden(mocker.MagicMock(), "Insufficient permissions")
+    )
+    
+    member2 = mocker.MagicMock(spec=discord.Member)
+    member2.name = "User2"
+    member2.roles = [role]
+    member2.remove_roles = mocker.AsyncMock()
+    
+    guild.members = [member1, member2]
+    role.members = [member1, member2]
+    mocker.patch('discord.utils.get', return_value=role)
+    log_error = mocker.patch("logging.error")
+    
+    # Act
+    result = await role_cog._remove_done_roles(guild)
+    
+    # Assert
+    assert result == 1
+    member2.remove_roles.assert_awaited_once_with(role, reason="daily reset")
+    log_error.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_done_role_lookup_is_cached(role_cog, mock_guild, mocker):
+    """Test the 'done' role is resolved once per guild until the role changes."""
+    # Arrange
+    role = mocker.MagicMock(spec=discord.Role)
+    role.guild = mock_guild
+    role.id = 11111
+    mock_guild.get_role = mocker.MagicMock(side_effect=lambda role_id: role if role_id == role.id else None)
+    mock_get = mocker.patch('discord.utils.get', return_value=role)
+    
+    # Act
+    assert role_cog._get_done_role(mock_guild) is role
+    assert role_cog._get_done_role(mock_guild) is role
+    await role_cog.on_guild_role_update(role, role)
+    assert role_cog._get_done_role(mock_guild) is role
+    
+    # Assert - one scan before the update, one after
+    assert mock_get.call_count == 2
+    assert role_cog._role_cache == {mock_guild.id: role.id}
+
+
+def test_general_channel_lookup_uses_oguri_cache(role_cog, mock_guild, mocker):
+    """Test the daily reset resolves #general through OguriCapCog's cache when it is loaded."""
+    # Arrange
+    channel = mocker.MagicMock()
+    oguri_cog = mocker.MagicMock()
+    oguri_cog._get_general_channel.return_value = channel
+    role_cog.bot.get_cog = mocker.MagicMock(return_value=oguri_cog)
+    mock_get = mocker.patch('discord.utils.get')
+    
+    # Act
+    result = role_cog._get_general_channel(mock_guild)
+    
+    # Assert
+    assert result is channel
+    role_cog.bot.get_cog.assert_called_once_with('OguriCapCog')
+    oguri_cog._get_general_channel.assert_called_once_with(mock_guild)
+    mock_get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_daily_reset_task_isolates_guild_failures(role_cog, mocker):
+    """Test one guild failing during the daily reset doesn't stop the others."""
+    # Arrange
+    guild1 = mocker.MagicMock(spec=discord.Guild)
+    guild1.name = "Guild1"
+    guild1.channels = []
+    guild2 = mocker.MagicMock(spec=discord.Guild)
+    guild2.name = "Guild2"
+    guild2.channels = []
+    role_cog.bot.guilds = [guild1, guild2]
+    mocker.patch.object(role_cog, '_remove_done_roles', side_effect=[RuntimeError("boom"), 3])
+    log_error = mocker.patch("logging.error")
+    log_info = mocker.patch("logging.info")
+    
+    # Act
+    await role_cog.daily_reset_task()
+    
+    # Assert
+    assert role_cog._remove_done_roles.await_count == 2
+    log_error.assert_called_once_with("Daily reset failed for guild Guild1: boom")
+    log_info.assert_called_with("Daily reset completed! Removed roles from 3 users.")
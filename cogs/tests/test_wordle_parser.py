@@ -1,7 +1,9 @@
 """
 Tests for WordleParser cog - Using conftest fixtures.
 """
+import logging
 import pytest
+from datetime import date
 from unittest.mock import MagicMock, AsyncMock
 import discord
 from discord.ext import commands
@@ -23,6 +25,7 @@ def mock_message(mock_guild, mock_channel):
     message = MagicMock(spec=discord.Message)
     message.author = MagicMock(spec=discord.Member)
     message.author.id = FAKE_WORDLE_BOT_ID  # Use constant for clarity
+    message.author.bot = False
     message.guild = mock_guild
     message.channel = mock_channel
     message.content = ""
@@ -61,8 +64,9 @@ async def test_detects_wordle_report(parser_cog, mock_message, sample_wordle_res
     # Act
     await parser_cog.on_message(mock_message)
         
-    # Assert
+    # Assert - the Wordle bot's own posts never need command resolution
     parser_cog.parse_wordle_results.assert_awaited_once_with(mock_message)
+    parser_cog.bot.get_context.assert_not_awaited()
 
 @pytest.mark.asyncio
 async def test_ignores_non_wordle_messages(parser_cog, mock_message):
@@ -78,6 +82,64 @@ async def test_ignores_non_wordle_messages(parser_cog, mock_message):
     # Assert - parse should NOT be called
     parser_cog.parse_wordle_results.assert_not_awaited()
 
+@pytest.mark.asyncio
+async def test_non_report_skips_command_lookup(parser_cog, mock_message):
+    """Test that ordinary chat never pays for command context resolution."""
+    # Arrange
+    mock_message.content = "Just a regular message"
+    parser_cog.bot.get_context = AsyncMock()
+    
+    # Act
+    await parser_cog.on_message(mock_message)
+    
+    # Assert
+    parser_cog.bot.get_context.assert_not_awaited()
+
+def test_manual_processing_flags_are_bounded(parser_cog, monkeypatch):
+    """Test the oldest manual-processing flags are dropped once the cap is reached."""
+    monkeypatch.setattr(parser_cog, 'MAX_MANUAL_MESSAGES', 2)
+    for message_id in (1, 2, 3):
+        parser_cog.mark_message_as_manual(message_id)
+    assert list(parser_cog.processing_manual) == [2, 3]
+    
+    parser_cog.unmark_message_as_manual(2)
+    parser_cog.unmark_message_as_manual(99)  # unknown ids are ignored
+    assert list(parser_cog.processing_manual) == [3]
+
+@pytest.mark.asyncio
+async def test_ignores_reports_from_other_bots(parser_cog, mock_message, sample_wordle_results):
+    """Test that bots other than the Wordle bot are dropped before any content checks."""
+    # Arrange
+    parser_cog.wordle_bot_id = FAKE_WORDLE_BOT_ID
+    mock_message.author.bot = True
+    mock_message.author.id = 424242
+    mock_message.content = sample_wordle_results
+    parser_cog.bot.get_context = AsyncMock()
+    parser_cog.parse_wordle_results = AsyncMock()
+    
+    # Act
+    await parser_cog.on_message(mock_message)
+    
+    # Assert
+    parser_cog.bot.get_context.assert_not_awaited()
+    parser_cog.parse_wordle_results.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_manual_report_skips_command_lookup(parser_cog, mock_message, sample_wordle_results):
+    """Test that reports already being handled manually stop before command context resolution."""
+    # Arrange
+    mock_message.content = sample_wordle_results
+    parser_cog.mark_message_as_manual(mock_message.id)
+    parser_cog.bot.get_context = AsyncMock()
+    parser_cog.parse_wordle_results = AsyncMock()
+    
+    # Act
+    await parser_cog.on_message(mock_message)
+    
+    # Assert
+    parser_cog.bot.get_context.assert_not_awaited()
+    parser_cog.parse_wordle_results.assert_not_awaited()
+
 @pytest.mark.asyncio
 async def test_parse_single_user_score(parser_cog, mock_message, sample_wordle_results, mock_user, mocker):
     """Test parsing a message with one user score."""
@@ -89,8 +151,7 @@ async def test_parse_single_user_score(parser_cog, mock_message, sample_wordle_r
     
     # Mock the DatabaseCog
     mock_database_cog = mocker.MagicMock()
-    mock_database_cog.has_duplicate_submission.return_value = False
-    mock_database_cog.save_wordle_score.return_value = True
+    mock_database_cog.insert_new_wordle_scores.return_value = (2, 0)
     parser_cog.bot.get_cog.return_value = mock_database_cog
 
     # Act
@@ -115,6 +176,22 @@ async def test_parse_no_scores_found(parser_cog, mock_message, sample_wordle_res
         "I found nothing worth recording. Either the report is broken, or you've all collectively failed me."
     )
 
+@pytest.mark.asyncio
+async def test_parse_without_database(parser_cog, mock_message, sample_wordle_results):
+    """Test parsing stops with a visible error when the DatabaseCog is missing."""
+    # Arrange
+    mock_message.content = sample_wordle_results
+    parser_cog.bot.get_cog.return_value = None
+    
+    # Act
+    await parser_cog.parse_wordle_results(mock_message)
+    
+    # Assert
+    mock_message.channel.send.assert_awaited_once_with(
+        "The database is currently unavailable. I can't record these results right now."
+    )
+    mock_message.guild.get_member.assert_not_called()
+
 @pytest.mark.asyncio 
 async def test_parse_failed_wordle_x_score(parser_cog, mock_message, sample_wordle_results, mock_user, mocker):
     """Test parsing a failed Wordle (X/6) gives 8 points."""
@@ -124,8 +201,7 @@ async def test_parse_failed_wordle_x_score(parser_cog, mock_message, sample_word
     
     # Mock the DatabaseCog
     mock_database_cog = mocker.MagicMock()
-    mock_database_cog.has_duplicate_submission.return_value = False
-    mock_database_cog.save_wordle_score.return_value = True
+    mock_database_cog.insert_new_wordle_scores.return_value = (2, 0)
     parser_cog.bot.get_cog.return_value = mock_database_cog
         
     # Act  
@@ -135,6 +211,84 @@ async def test_parse_failed_wordle_x_score(parser_cog, mock_message, sample_word
     mock_message.channel.send.assert_awaited_once_with(
         "I've recorded the results for 2 participants. Better not have cheated."
     )
+    rows = mock_database_cog.insert_new_wordle_scores.call_args[0][0]
+    assert [row[3] for row in rows] == [8, 5]
+
+@pytest.mark.asyncio
+async def test_parse_logs_one_info_summary(parser_cog, mock_message, sample_wordle_results, mock_user, mocker, caplog):
+    """Test a parsed report logs a single INFO summary and keeps the raw content at DEBUG."""
+    # Arrange
+    mock_message.content = sample_wordle_results
+    mock_message.guild.get_member.return_value = mock_user
+    mock_database_cog = mocker.MagicMock()
+    mock_database_cog.insert_new_wordle_scores.return_value = (2, 0)
+    parser_cog.bot.get_cog.return_value = mock_database_cog
+    caplog.set_level(logging.INFO)
+    
+    # Act
+    await parser_cog.parse_wordle_results(mock_message)
+    
+    # Assert
+    assert "Parsed Wordle report: 2 saved, 0 duplicates" in caplog.messages
+    assert not any("383926733394542592" in msg for msg in caplog.messages)
+
+@pytest.mark.asyncio
+async def test_parse_dedupes_repeated_mentions(parser_cog, mock_message, sample_wordle_results, mock_user, mocker):
+    """Test a user mentioned twice in one report is only sent to the database once."""
+    # Arrange
+    mock_message.content = sample_wordle_results + "\n6/6: <@383926733394542592>"
+    mock_message.guild.get_member.return_value = mock_user
+    mock_database_cog = mocker.MagicMock()
+    mock_database_cog.insert_new_wordle_scores.return_value = (2, 0)
+    parser_cog.bot.get_cog.return_value = mock_database_cog
+    
+    # Act
+    await parser_cog.parse_wordle_results(mock_message)
+    
+    # Assert - first score wins
+    rows = mock_database_cog.insert_new_wordle_scores.call_args[0][0]
+    assert [(row[0], row[3]) for row in rows] == [(383926733394542592, 4), (714203809529856110, 5)]
+    assert {row[4] for row in rows} == {date.today().isoformat()}
+
+@pytest.mark.asyncio
+async def test_parse_flags_duplicate_submissions(parser_cog, mock_message, sample_wordle_results, mock_user, mocker):
+    """Test partly duplicate reports get one summary reply and a single ✅ reaction."""
+    # Arrange
+    mock_message.content = sample_wordle_results
+    mock_message.guild.get_member.return_value = mock_user
+    mock_database_cog = mocker.MagicMock()
+    mock_database_cog.insert_new_wordle_scores.return_value = (1, 1)
+    parser_cog.bot.get_cog.return_value = mock_database_cog
+    
+    # Act
+    await parser_cog.parse_wordle_results(mock_message)
+    
+    # Assert - both scores go out in a single batch
+    mock_database_cog.insert_new_wordle_scores.assert_called_once()
+    mock_message.add_reaction.assert_awaited_once_with("✅")
+    mock_message.channel.send.assert_awaited_once_with(
+        "I've recorded the results for 1 participants. Better not have cheated. "
+        "1 were already on record, so I left them alone."
+    )
+
+@pytest.mark.asyncio
+async def test_parse_all_duplicates(parser_cog, mock_message, sample_wordle_results, mock_user, mocker):
+    """Test a report with nothing new gets one ❌ reaction and a single reply."""
+    # Arrange
+    mock_message.content = sample_wordle_results
+    mock_message.guild.get_member.return_value = mock_user
+    mock_database_cog = mocker.MagicMock()
+    mock_database_cog.insert_new_wordle_scores.return_value = (0, 2)
+    parser_cog.bot.get_cog.return_value = mock_database_cog
+    
+    # Act
+    await parser_cog.parse_wordle_results(mock_message)
+    
+    # Assert
+    mock_message.add_reaction.assert_awaited_once_with("❌")
+    mock_message.channel.send.assert_awaited_once_with(
+        "Everyone in this report is already on record. Nothing new to write down."
+    )
 
 @pytest.mark.asyncio
 async def test_processes_simulation_mode(parser_cog, mock_message, sample_wordle_results):
@@ -203,8 +357,8 @@ async def test_add_manual_score_valid_single_user(parser_cog, mocker):
         ctx.send = AsyncMock()
         parser_cog.validate_date = AsyncMock(return_value=True)
         db_cog = mocker.MagicMock()
-        db_cog.has_duplicate_submission.return_value = False
-        db_cog.save_wordle_score.return_value = True
+        db_cog.get_user_ids_for_date.return_value = set()
+        db_cog.save_if_new.return_value = True
         parser_cog.bot.get_cog.return_value = db_cog
 
         await parser_cog.add_manual_score.callback(parser_cog, ctx, "2024-06-01", score_data="3/6")
@@ -214,6 +368,24 @@ async def test_add_manual_score_valid_single_user(parser_cog, mocker):
         )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("score_data", ["x/6", "x"])
+async def test_add_manual_score_lowercase_x_counts_as_failure(parser_cog, mocker, score_data):
+    ctx = MagicMock()
+    ctx.author.id = 1111
+    ctx.guild.id = 2222
+    ctx.guild.get_member.return_value = MagicMock(display_name="TestUser")
+    ctx.message.add_reaction = AsyncMock()
+    ctx.send = AsyncMock()
+    parser_cog.validate_date = AsyncMock(return_value=True)
+    db_cog = mocker.MagicMock()
+    db_cog.get_user_ids_for_date.return_value = set()
+    db_cog.save_if_new.return_value = True
+    parser_cog.bot.get_cog.return_value = db_cog
+
+    await parser_cog.add_manual_score.callback(parser_cog, ctx, "2024-06-01", score_data=score_data)
+    db_cog.save_if_new.assert_called_once_with(1111, 2222, "TestUser", 8, "2024-06-01")
+
 @pytest.mark.asyncio
 async def test_add_manual_score_duplicate_submission(parser_cog, mocker):
     ctx = MagicMock()
@@ -224,8 +396,8 @@ async def test_add_manual_score_duplicate_submission(parser_cog, mocker):
     ctx.send = AsyncMock()
     parser_cog.validate_date = AsyncMock(return_value=True)
     db_cog = mocker.MagicMock()
-    db_cog.has_duplicate_submission.return_value = True
-    db_cog.save_wordle_score.return_value = True
+    db_cog.get_user_ids_for_date.return_value = {1111}
+    db_cog.save_if_new.return_value = True
     parser_cog.bot.get_cog.return_value = db_cog
 
     await parser_cog.add_manual_score.callback(parser_cog, ctx, "2024-06-01", score_data="3/6")
@@ -234,6 +406,26 @@ async def test_add_manual_score_duplicate_submission(parser_cog, mocker):
     ctx.message.add_reaction.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_add_manual_score_repeated_mention_saved_once(parser_cog, mocker):
+    ctx = MagicMock()
+    ctx.author.id = 1111
+    ctx.guild.id = 2222
+    ctx.guild.get_member.return_value = MagicMock(display_name="TestUser")
+    ctx.message.add_reaction = AsyncMock()
+    ctx.send = AsyncMock()
+    parser_cog.validate_date = AsyncMock(return_value=True)
+    db_cog = mocker.MagicMock()
+    db_cog.get_user_ids_for_date.return_value = set()
+    db_cog.save_if_new.return_value = True
+    parser_cog.bot.get_cog.return_value = db_cog
+
+    await parser_cog.add_manual_score.callback(parser_cog, ctx, "2024-06-01", score_data="3/6 <@5> <@5>")
+    db_cog.get_user_ids_for_date.assert_called_once_with(2222, "2024-06-01")
+    db_cog.save_if_new.assert_called_once()
+    ctx.send.assert_awaited_with("❌ TestUser already has a score for 2024-06-01")
+
+
 @pytest.mark.asyncio
 async def test_add_manual_score_invalid_score_format(parser_cog, mocker):
         ctx = MagicMock()
@@ -276,8 +468,8 @@ async def test_add_manual_score_multiple_users_wordle_format(parser_cog, mocker)
     ctx.send = AsyncMock()
     parser_cog.validate_date = AsyncMock(return_value=True)
     db_cog = mocker.MagicMock()
-    db_cog.has_duplicate_submission.return_value = False
-    db_cog.save_wordle_score.return_value = True
+    db_cog.get_user_ids_for_date.return_value = set()
+    db_cog.save_if_new.return_value = True
     parser_cog.bot.get_cog.return_value = db_cog
 
     score_data = "3/6: <@1111> 4/6: <@2222>"
@@ -288,6 +480,27 @@ async def test_add_manual_score_multiple_users_wordle_format(parser_cog, mocker)
     )
 
 
+@pytest.mark.asyncio
+async def test_add_manual_score_logs_one_info_summary(parser_cog, mocker, caplog):
+    """Test a manual addition logs per-score detail at DEBUG and one INFO summary."""
+    ctx = MagicMock()
+    ctx.guild.id = 2222
+    ctx.guild.get_member.return_value = MagicMock(display_name="UserA")
+    ctx.message.add_reaction = AsyncMock()
+    ctx.send = AsyncMock()
+    parser_cog.validate_date = AsyncMock(return_value=True)
+    db_cog = mocker.MagicMock()
+    db_cog.get_user_ids_for_date.return_value = {3333}
+    db_cog.save_if_new.return_value = True
+    parser_cog.bot.get_cog.return_value = db_cog
+    caplog.set_level(logging.INFO)
+
+    await parser_cog.add_manual_score.callback(parser_cog, ctx, "2024-06-01", score_data="3/6: <@1111> <@3333>")
+
+    assert "Manual scores for 2024-06-01 in guild 2222: 1 saved, 1 errors" in caplog.messages
+    assert not any(msg.startswith(("Manual score added", "Duplicate score")) for msg in caplog.messages)
+
+
 @pytest.mark.asyncio
 async def test_add_manual_score_database_unavailable(parser_cog, mocker):
     ctx = MagicMock()
@@ -315,7 +528,7 @@ async def test_overwrite_manual_score_valid(parser_cog, mocker):
     ctx.send = AsyncMock()
     parser_cog.validate_date = AsyncMock(return_value=True)
     db_cog = mocker.MagicMock()
-    db_cog.save_wordle_score.return_value = True
+    db_cog.upsert_wordle_scores.return_value = True
     parser_cog.bot.get_cog.return_value = db_cog
 
     await parser_cog.overwrite_manual_score.callback(parser_cog, ctx, "2024-06-01", score_data="3/6")
@@ -335,17 +548,39 @@ async def test_overwrite_manual_score_multiple_users(parser_cog, mocker):
     ctx.send = AsyncMock()
     parser_cog.validate_date = AsyncMock(return_value=True)
     db_cog = mocker.MagicMock()
-    db_cog.save_wordle_score.return_value = True
+    db_cog.upsert_wordle_scores.return_value = True
     parser_cog.bot.get_cog.return_value = db_cog
 
     score_data = "3/6: <@1111> 4/6: <@2222>"
     await parser_cog.overwrite_manual_score.callback(parser_cog, ctx, "2024-06-01", score_data=score_data)
+    db_cog.upsert_wordle_scores.assert_called_once_with([
+        (1111, 2222, "UserA", 3, "2024-06-01"),
+        (2222, 2222, "UserA", 3, "2024-06-01"),
+    ])
     ctx.message.add_reaction.assert_awaited_with("✅")
     ctx.send.assert_awaited_with(
         "Multiple records have been corrected.\nDate: 2024-06-01\nEntries modified: 2\nPrecision maintained."
     )
 
 
+@pytest.mark.asyncio
+async def test_overwrite_manual_score_failed_batch_reports_every_user(parser_cog, mocker):
+    ctx = MagicMock()
+    ctx.guild.id = 2222
+    ctx.guild.get_member.return_value = MagicMock(display_name="UserA")
+    ctx.author.id = 1111
+    ctx.message.add_reaction = AsyncMock()
+    ctx.send = AsyncMock()
+    parser_cog.validate_date = AsyncMock(return_value=True)
+    db_cog = mocker.MagicMock()
+    db_cog.upsert_wordle_scores.return_value = False
+    parser_cog.bot.get_cog.return_value = db_cog
+
+    await parser_cog.overwrite_manual_score.callback(parser_cog, ctx, "2024-06-01", score_data="3/6: <@1111> <@2222>")
+    ctx.message.add_reaction.assert_not_awaited()
+    ctx.send.assert_awaited_once_with("❌ Failed to save score for UserA\n❌ Failed to save score for UserA")
+
+
 @pytest.mark.asyncio
 async def test_overwrite_manual_score_invalid_format(parser_cog, mocker):
     ctx = MagicMock()
@@ -378,3 +613,48 @@ async def test_overwrite_manual_score_database_unavailable(parser_cog, mocker):
     ctx.send.assert_awaited_with(
         "Database systems are offline. Even the best strategies require functional infrastructure."
     )
+
+
+@pytest.mark.parametrize("content,expected", [
+    ("Your group is on an 87 day streak!  Here are yesterday's results:\n4/6: <@1>", True),
+    ("Your group is on an 87 day streak!", False),
+    ("Here are yesterday's results:", False),
+    ("Just a regular message", False),
+])
+def test_is_wordle_report(content, expected):
+    """Test Wordle report detection needs both the streak and results markers."""
+    assert WordleParser.is_wordle_report(content) is expected
+
+
+@pytest.mark.parametrize("line", [
+    "4/6:  <@383926733394542592>  ",
+    "👑 3/6: <@1> <@!2>",
+    "X/6: <@3>",
+    "/6: <@4> then 5/6: <@5>",
+    "5/6 <@6>",
+    "no score here <@7>",
+    "2/6: <@12<@34> <@abc> <@!> <@56",
+])
+def test_report_line_scanning_matches_regex(line):
+    """Test the string scanners agree with the regex patterns they replace."""
+    score_match = WordleParser.PARSE_SCORE_PATTERN.search(line)
+    expected_score = None
+    if score_match:
+        expected_score = 8 if score_match.group(1) == 'X' else int(score_match.group(1))
+    
+    expected_lines = [] if expected_score is None else [(expected_score, line)]
+    assert list(WordleParser._scan_report_lines(line)) == expected_lines
+    assert WordleParser._scan_mentions(line) == WordleParser.PARSE_USER_PATTERN.findall(line)
+
+
+def test_report_line_scanning_walks_whole_message(sample_wordle_results):
+    """Test scanning the whole report finds the same scored lines as splitting it first."""
+    content = sample_wordle_results + "\n/6: <@9>\nX/6: <@3>\nno score <@7>"
+    expected = []
+    for line in content.split("\n"):
+        score_match = WordleParser.PARSE_SCORE_PATTERN.search(line)
+        if score_match:
+            expected.append((8 if score_match.group(1) == 'X' else int(score_match.group(1)), line))
+    
+    assert list(WordleParser._scan_report_lines(content)) == expected
+    assert len(expected) == 3
@@ -1,5 +1,6 @@
 import discord
 from discord.ext import commands
+from typing import Optional
 import logging
 import asyncio
 
@@ -9,37 +10,44 @@ class UtilityCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         """Initialize the UtilityCog with bot instance."""
         self.bot = bot
+        # Prebuilt show_all_commands embed and the (cog names, command count) it was built for
+        self._all_cmds_embed = None
+        self._all_cmds_key = None
 
-    @commands.command(aliases=["allcommands", "commands", "cmds"])
-    async def show_all_commands(self, ctx: commands.Context) -> None:
-        """List all commands available across all cogs"""
-        all_commands = {}
-        
-        # Get commands from all cogs
-        for cog_name, cog in self.bot.cogs.items():
-            cog_commands = [command.name for command in cog.get_commands()]
-            if cog_commands:
-                all_commands[cog_name] = cog_commands
-        
-        # Format the output
-        if not all_commands:
-            await ctx.send("No commands found. Something is very wrong.")
-            return
-        
+    def _build_all_commands_embed(self) -> Optional[discord.Embed]:
+        """Build the command list embed, or return None if no cog has commands"""
         embed = discord.Embed(
             title="All Available Commands",
             description="Complete command list across all systems",
             color=0x4d79ff
         )
         
-        for cog_name, commands_list in all_commands.items():
-            embed.add_field(
-                name=f"{cog_name}",
-                value=", ".join(commands_list),
-                inline=False
-            )
+        # Single pass over the cogs, writing straight into the embed
+        has_any = False
+        for cog_name, cog in self.bot.cogs.items():
+            names = ", ".join(command.name for command in cog.get_commands())
+            if names:
+                embed.add_field(name=cog_name, value=names, inline=False)
+                has_any = True
+        
+        if not has_any:
+            return None
+        return embed
+
+    @commands.command(aliases=["allcommands", "commands", "cmds"])
+    async def show_all_commands(self, ctx: commands.Context) -> None:
+        """List all commands available across all cogs"""
+        # Commands only change when cogs are added or removed, so rebuild only then
+        key = (tuple(self.bot.cogs), len(self.bot.all_commands))
+        if self._all_cmds_key != key:
+            self._all_cmds_embed = self._build_all_commands_embed()
+            self._all_cmds_key = key
+        
+        if not self._all_cmds_embed:
+            await ctx.send("No commands found. Something is very wrong.")
+            return
         
-        await ctx.send(embed=embed)
+        await ctx.send(embed=self._all_cmds_embed)
 
     @commands.command()
     @commands.is_owner()
@@ -64,10 +72,7 @@ class UtilityCog(commands.Cog):
             return
         
         database_cog.log_channel_id = channel.id
-        
-        root_logger = logging.getLogger()
-        if database_cog.discord_handler not in root_logger.handlers:
-            root_logger.addHandler(database_cog.discord_handler)
+        database_cog.attach_log_handler()
         
         await ctx.message.add_reaction("✅")
         await ctx.send(f"Terminal logs now being sent to {channel.mention}, good job.")
@@ -90,12 +95,7 @@ class UtilityCog(commands.Cog):
             await ctx.send("Database system unavailable. Cannot disable logging.")
             return
         
-        root_logger = logging.getLogger()
-        try:
-            root_logger.removeHandler(database_cog.discord_handler)
-        except ValueError:
-            pass  
-        
+        database_cog.detach_log_handler()
         database_cog.log_channel_id = None
         await ctx.message.add_reaction("✅")
         await ctx.send("Terminal log capture disabled. Why would you turn off something so useful?")
@@ -3,7 +3,9 @@ from discord.ext import commands
 import logging
 import re
 import os
-from datetime import datetime
+import asyncio
+from collections import OrderedDict
+from datetime import date as Date  # aliased: commands take a 'date' string argument
 
 
 
@@ -15,19 +17,22 @@ class WordleParser(commands.Cog):
     and saves them to a SQLite database for leaderboard tracking.
     """
     
-    # Regex patterns for Wordle score parsing
-    WORDLE_SCORE_PATTERN = r'\d+/6:|X/6:'
-    SCORE_MATCH_PATTERN = r'^(\d|X)/6:?$'
-    USER_MENTION_PATTERN = r'^<@!?(\d+)>$'
-    PARSE_SCORE_PATTERN = r'(\d|X)/6:'
-    PARSE_USER_PATTERN = r'<@!?(\d+)>'
+    # Regex patterns for Wordle score parsing, compiled once at class creation
+    PARSE_SCORE_PATTERN = re.compile(r'([\dX])/6:')
+    PARSE_USER_PATTERN = re.compile(r'<@!?(\d+)>')
+    LOOSE_SCORE_PATTERN = re.compile(r'([\dX])/6', re.IGNORECASE)         # "5/6 @user" without the colon
+    MENTION_STRIP_PATTERN = re.compile(r'<@!?\d+>')
+    STANDALONE_SCORE_PATTERN = re.compile(r'\b([\dX])\b', re.IGNORECASE)  # bare "3" or "X"
     
     # Message detection patterns
     STREAK_TEXT = "day streak"
     RESULTS_TEXT = "Here are yesterday's results:"
+    MIN_REPORT_LENGTH = len(STREAK_TEXT) + len(RESULTS_TEXT)  # anything shorter can't hold both markers
     
     # Valid Wordle score values (1-6 attempts, 8 for failed/X)
-    VALID_SCORES = [1, 2, 3, 4, 5, 6, 8]
+    VALID_SCORES = frozenset({1, 2, 3, 4, 5, 6, 8})  # frozenset for O(1) membership checks
+    SCORE_VALUES = {**{str(n): n for n in range(10)}, 'X': 8}  # score character -> points, for the report scanner
+    MAX_MANUAL_MESSAGES = 1024  # manual-processing flags kept before the oldest are dropped
     
     def __init__(self, bot: commands.Bot) -> None:
         """Initialize the WordleParser with bot instance."""
@@ -44,19 +49,98 @@ class WordleParser(commands.Cog):
                 logging.error(f"Invalid WORDLE_BOT_ID: {wordle_bot_id_str}")
                 self.wordle_bot_id = 0
         
-        # Track messages being processed manually to avoid double processing
-        self.processing_manual = set()
+        # Track messages being processed manually to avoid double processing.
+        # Insertion-ordered and capped, so flags never unmarked by a failed flow can't pile up
+        self.processing_manual = OrderedDict()
 
     def mark_message_as_manual(self, message_id: int) -> None:
         """Mark a message as being processed manually to prevent auto-processing."""
-        self.processing_manual.add(message_id)
+        self.processing_manual[message_id] = None
+        self.processing_manual.move_to_end(message_id)
+        if len(self.processing_manual) > self.MAX_MANUAL_MESSAGES:
+            self.processing_manual.popitem(last=False)
         logging.info(f"Message {message_id} marked for manual processing")
     
     def unmark_message_as_manual(self, message_id: int) -> None:
         """Remove manual processing flag from a message."""
-        self.processing_manual.discard(message_id)
+        self.processing_manual.pop(message_id, None)
         logging.info(f"Message {message_id} unmarked from manual processing")
 
+    def invalidate_leaderboard(self, guild_id: int) -> None:
+        """Tell the LeaderboardCog to drop its cached leaderboard after new scores are saved."""
+        leaderboard_cog = self.bot.get_cog('LeaderboardCog')
+        if leaderboard_cog:
+            leaderboard_cog.invalidate_leaderboard_cache(guild_id)
+
+    @classmethod
+    def is_wordle_report(cls, content: str) -> bool:
+        """Check whether message content looks like a Wordle bot daily results report."""
+        # Length first, then the longer (rarer) marker so most messages fail fast
+        return (
+            len(content) >= cls.MIN_REPORT_LENGTH
+            and cls.RESULTS_TEXT in content
+            and cls.STREAK_TEXT in content
+        )
+
+    @classmethod
+    def _scan_report_lines(cls, content: str):
+        """
+        Yield the score and text of each report line that has an "N/6:" or "X/6:" marker.
+        
+        Walks the markers in the whole message instead of splitting it into lines first,
+        so header and footer lines without a score are never copied. Plain string
+        scanning - equivalent to running PARSE_SCORE_PATTERN on each line, without the regex engine.
+        
+        Args:
+            content: The full Wordle bot report.
+        
+        Yields:
+            (score, line) pairs in message order, using the first valid marker on the line (X counts as 8).
+        """
+        score_values = cls.SCORE_VALUES
+        idx = content.find('/6:')
+        while idx != -1:
+            score = score_values.get(content[idx - 1]) if idx else None
+            if score is None:
+                idx = content.find('/6:', idx + 1)
+                continue
+            line_start = content.rfind('\n', 0, idx) + 1
+            line_end = content.find('\n', idx)
+            if line_end == -1:
+                line_end = len(content)
+            yield score, content[line_start:line_end]
+            idx = content.find('/6:', line_end)
+
+    @staticmethod
+    def _scan_mentions(line: str) -> list:
+        """
+        Collect the user IDs of every <@id> / <@!id> mention in a line, in order.
+        
+        Plain string scanning - equivalent to PARSE_USER_PATTERN.findall, without the regex engine.
+        
+        Args:
+            line: The text to scan.
+        
+        Returns:
+            List of user ID strings.
+        """
+        user_ids = []
+        pos = line.find('<@')
+        while pos != -1:
+            start = pos + 2
+            if line.startswith('!', start):
+                start += 1
+            end = line.find('>', start)
+            if end == -1:
+                break
+            user_id = line[start:end]
+            if user_id.isdecimal():
+                user_ids.append(user_id)
+                pos = line.find('<@', end + 1)
+            else:
+                pos = line.find('<@', pos + 2)
+        return user_ids
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
         """
@@ -68,24 +152,31 @@ class WordleParser(commands.Cog):
         if message.author == self.bot.user:
             return
         
-        # Skip processing if this is a bot command
-        ctx = await self.bot.get_context(message)
-        if ctx.valid:
-            logging.info("Skipping automatic processing - this is a bot command")
+        # Other bots never post reports; only humans may simulate one for testing
+        from_wordle_bot = message.author.id == self.wordle_bot_id
+        if message.author.bot and not from_wordle_bot:
+            return
+        
+        # Cheap substring check first - almost every message stops here
+        if not self.is_wordle_report(message.content):
             return
         
         # Skip processing if this message is being handled manually
         if message.id in self.processing_manual:
             logging.info(f"Skipping automatic processing for message {message.id} - being handled manually")
             return
-
-        if message.author.id == self.wordle_bot_id and self.STREAK_TEXT in message.content and self.RESULTS_TEXT in message.content:   
+        
+        if from_wordle_bot:
             logging.info("Wordle report detected.")
-            await self.parse_wordle_results(message)
-        elif self.STREAK_TEXT in message.content and self.RESULTS_TEXT in message.content:
+        else:
+            # Skip processing if this is a bot command (the Wordle bot never sends ours)
+            ctx = await self.bot.get_context(message)
+            if ctx.valid:
+                logging.info("Skipping automatic processing - this is a bot command")
+                return
             # Testing purpose: simulate Wordle bot messages
             logging.info("Simulated Wordle report detected.")
-            await self.parse_wordle_results(message)
+        await self.parse_wordle_results(message)
 
     async def parse_wordle_results(self, message: discord.Message) -> None:
         """
@@ -96,91 +187,82 @@ class WordleParser(commands.Cog):
         """
  
 
-        logging.info(f"Parsing Wordle message from {message.author}")
-        logging.info(f"Message content:\n{message.content}")
+        # Per-message detail stays at DEBUG; %-style args are only formatted if it is enabled
+        logging.debug("Parsing Wordle message from %s", message.author)
+        logging.debug("Message content:\n%s", message.content)
+
+        database_cog = self.bot.get_cog('DatabaseCog')
+        if not database_cog:
+            logging.error("DatabaseCog not found!")
+            await message.channel.send("The database is currently unavailable. I can't record these results right now.")
+            return
+        today = Date.today().isoformat()  # date only - no time-of-day or strftime work
 
-        total_saved = 0
+        guild_id = message.guild.id
+        get_member = message.guild.get_member
         
         # Parse each line to get users and their scores
-        lines = message.content.split('\n')
-        for line in lines:
-            if '/6:' in line:
-                # Extract score and users from each line (including X/6 for failures)
-                score_match = re.search(self.PARSE_SCORE_PATTERN, line)
-                if score_match:
-                    score_str = score_match.group(1)
-                    # Convert X to 8 points, numbers stay as numbers
-                    score = 8 if score_str == 'X' else int(score_str)
-                    
-                    # Extract mentioned users (@ mentions)
-                    user_mentions = re.findall(self.PARSE_USER_PATTERN, line)
-                    
-                    for user_id in user_mentions:
-                        try:
-                            member_id = int(user_id)
-                    
-                            user = message.guild.get_member(member_id)
-                            username = user.display_name if user else f"Unknown_{user_id}"
-                            
-                            # Get database cog and save score
-                            database_cog = self.bot.get_cog('DatabaseCog')
-                            if database_cog:
-                                today = datetime.now().strftime('%Y-%m-%d')
-                            
-                                if database_cog.has_duplicate_submission(user_id, message.guild.id, today):
-                                    logging.info(f"Duplicate submission ignored: {username} already recorded for {today}")
-                                    await message.add_reaction("❌")
-                                    continue
-                                
-                                success = database_cog.save_wordle_score(user_id, message.guild.id, username, score, today)
-                                if success:
-                                    logging.info(f"Saved: {username} ({user_id}) = {score} points")
-                                    total_saved += 1
-                                else:
-                                    logging.error(f"Failed to save score for {username}")
-                            else:
-                                logging.error("DatabaseCog not found!")
-                            
-                        except ValueError:
-                            logging.warning(f"Invalid user ID format: {user_id}")
-                        except Exception as e:
-                            logging.error(f"Unexpected error processing user {user_id}: {e}")
+        rows = []
+        seen = set()  # one score per user per day - later mentions of the same user are dropped
+        for score, line in self._scan_report_lines(message.content):
+            # Users mentioned anywhere on a scored line get that score (including X/6 for failures)
+            for mention in self._scan_mentions(line):
+                user_id = int(mention)  # stored as INTEGER, like every Discord ID in the database
+                if user_id in seen:
+                    continue
+                seen.add(user_id)
+                user = get_member(user_id)
+                username = user.display_name if user else f"Unknown_{user_id}"
+                rows.append((user_id, guild_id, username, score, today))
         
+        total_saved = duplicates = 0
+        if rows:
+            # One blocking transaction for the whole report, kept off the event loop
+            total_saved, duplicates = await asyncio.to_thread(database_cog.insert_new_wordle_scores, rows)
+            logging.info("Parsed Wordle report: %d saved, %d duplicates", total_saved, duplicates)
+        
+        # One reply and one reaction per report, whatever the mix of new scores and duplicates
         if total_saved > 0:
-            await message.channel.send(f"I've recorded the results for {total_saved} participants. Better not have cheated.")
-            await message.add_reaction("✅")
+            self.invalidate_leaderboard(guild_id)
+            reply = f"I've recorded the results for {total_saved} participants. Better not have cheated."
+            if duplicates:
+                reply += f" {duplicates} were already on record, so I left them alone."
+            await asyncio.gather(message.channel.send(reply), message.add_reaction("✅"))
+        elif duplicates:
+            await asyncio.gather(
+                message.channel.send("Everyone in this report is already on record. Nothing new to write down."),
+                message.add_reaction("❌")
+            )
         else:
             await message.channel.send("I found nothing worth recording. Either the report is broken, or you've all collectively failed me.")
 
-
     async def validate_date(self, date: str, ctx: commands.Context) -> bool:
         """Validate date string is in YYYY-MM-DD format with zero-padded days/months."""
         # First check exact format length and structure
         if len(date) != 10 or date[4] != '-' or date[7] != '-':
-            await ctx.message.add_reaction("❌")
-            await ctx.send("Your date format is... inadequate. Use YYYY-MM-DD format. Precision matters. Zero-pad single digits.")
+            await asyncio.gather(
+                ctx.message.add_reaction("❌"),
+                ctx.send("Your date format is... inadequate. Use YYYY-MM-DD format. Precision matters. Zero-pad single digits.")
+            )
             return False
             
         # Check if all parts are digits in correct positions
         if not (date[:4].isdigit() and date[5:7].isdigit() and date[8:10].isdigit()):
-            await ctx.message.add_reaction("❌")
-            await ctx.send("Your date format is... inadequate. Use YYYY-MM-DD format. Precision matters. Zero-pad single digits.")
+            await asyncio.gather(
+                ctx.message.add_reaction("❌"),
+                ctx.send("Your date format is... inadequate. Use YYYY-MM-DD format. Precision matters. Zero-pad single digits.")
+            )
             return False
             
         try:
-            # Verify it's a valid date
-            parsed_date = datetime.strptime(date, '%Y-%m-%d')
-            
-            # Ensure the formatted date matches input (catches invalid dates like 2025-13-01)
-            if parsed_date.strftime('%Y-%m-%d') != date:
-                await ctx.message.add_reaction("❌")
-                await ctx.send("That date doesn't exist in reality. I demand temporal accuracy.")
-                return False
-                
+            # The shape is already exact, so this only rejects dates that don't exist (e.g. 2025-13-01)
+            Date.fromisoformat(date)
             return True
         except ValueError:
-            await ctx.message.add_reaction("❌")
-            await ctx.send("Your date format is... inadequate. Use YYYY-MM-DD format. Precision matters. Zero-pad single digits.")
+            await asyncio.gather(
+                ctx.message.add_reaction("❌"),
+                ctx.send("Your date format is... inadequate. Use YYYY-MM-DD format. Precision matters. Zero-pad single digits.")
+            )
             return False
 
     @commands.command(aliases=["addscore", "add_score", "manual_score"])
@@ -205,7 +287,7 @@ class WordleParser(commands.Cog):
             woguri add_score 2024-10-01 3/6 @doa
             woguri add_score 2024-10-01 "3/6: @doa @user2 4/6: @user3"
         """
-        logging.info(f"Manual score addition requested by {ctx.author} for date {date} with data: {score_data}")
+        logging.info("Manual score addition requested by %s for date %s with data: %s", ctx.author, date, score_data)
         
         valid_date = await self.validate_date(date, ctx)
         if not valid_date:
@@ -213,26 +295,34 @@ class WordleParser(commands.Cog):
         
         database_cog = self.bot.get_cog('DatabaseCog')
         if not database_cog:
-            await ctx.message.add_reaction("❌")
-            await ctx.send("The database is currently unavailable. Even champions need proper record-keeping systems.")
+            await asyncio.gather(
+                ctx.message.add_reaction("❌"),
+                ctx.send("The database is currently unavailable. Even champions need proper record-keeping systems.")
+            )
             logging.error("DatabaseCog not found!")
             return
         
+        guild_id = ctx.guild.id
+        get_member = ctx.guild.get_member
+        # One query for everyone already recorded on this date, instead of a SELECT per user.
+        # Database calls run in a worker thread so a slow disk never stalls the gateway
+        existing = await asyncio.to_thread(database_cog.get_user_ids_for_date, guild_id, date)
         saved_count = 0
         errors = []
         
         # Use the same parsing logic as the automatic parser - much more reliable!
-        lines = score_data.split('\n')
+        lines = score_data.splitlines()
         for line in lines:
-            if '/6:' in line or '/6' in line:
-                # Extract score and users from each line (including X/6 for failures)
-                score_match = re.search(self.PARSE_SCORE_PATTERN, line)
+            if '/6' in line:
+                # Extract score and users from each line (including X/6 for failures);
+                # the literal '/6:' check skips the colon regex for simple "5/6 @user" input
+                score_match = self.PARSE_SCORE_PATTERN.search(line) if '/6:' in line else None
                 if not score_match:
                     # Try without colon for simple format like "5/6 @user"
-                    score_match = re.search(r'(\d|X)/6', line.upper())
+                    score_match = self.LOOSE_SCORE_PATTERN.search(line)
                 
                 if score_match:
-                    score_str = score_match.group(1)
+                    score_str = score_match.group(1).upper()  # patterns accept a lowercase x
                     score_value = 8 if score_str == 'X' else int(score_str)
                     
                     # Validate score is within acceptable range
@@ -241,40 +331,41 @@ class WordleParser(commands.Cog):
                         continue
                     
                     # Extract mentioned users (@ mentions)
-                    user_mentions = re.findall(self.PARSE_USER_PATTERN, line)
+                    user_mentions = [int(user_id) for user_id in self._scan_mentions(line)]
                     
                     if not user_mentions:
                         # No mentions found, default to command author
-                        user_mentions = [str(ctx.author.id)]
+                        user_mentions = [ctx.author.id]
                         logging.info("No user mentions found, defaulting to command author")
                     
                     for user_id in user_mentions:
-                        member_id = int(user_id)
-                        user = ctx.guild.get_member(member_id)
+                        user = get_member(user_id)
                         username = user.display_name if user else f"Unknown_{user_id}"
                         
-                        if database_cog.has_duplicate_submission(user_id, ctx.guild.id, date):
+                        if user_id in existing:
                             errors.append(f"{username} already has a score for {date}")
-                            logging.info(f"Duplicate score submission detected for {username} on {date}")
+                            logging.debug("Duplicate score submission detected for %s on %s", username, date)
                             continue
                         
-                        success = database_cog.save_wordle_score(user_id, ctx.guild.id, username, score_value, date)
+                        # Insert-only, so a score recorded since the lookup above is never overwritten
+                        success = await asyncio.to_thread(database_cog.save_if_new, user_id, guild_id, username, score_value, date)
                         if success:
+                            existing.add(user_id)
                             saved_count += 1
-                            logging.info(f"Manual score added: {username} ({user_id}) = {score_value} points on {date}")
+                            logging.debug("Manual score added: %s (%s) = %d points on %s", username, user_id, score_value, date)
                         else:
                             errors.append(f"Failed to save score for {username}")
             else:
                 # Handle lines without /6 format - look for standalone scores
                 # Extract all user mentions first
-                user_mentions = re.findall(self.PARSE_USER_PATTERN, line)
+                user_mentions = [int(user_id) for user_id in self._scan_mentions(line)]
                 
                 # Look for standalone score (just a number or X)
-                clean_line = re.sub(r'<@!?\d+>', '', line).strip()
-                score_match = re.search(r'\b(\d|X)\b', clean_line.upper())
+                clean_line = self.MENTION_STRIP_PATTERN.sub('', line).strip()
+                score_match = self.STANDALONE_SCORE_PATTERN.search(clean_line)
                 
                 if score_match:
-                    score_str = score_match.group(1)
+                    score_str = score_match.group(1).upper()  # patterns accept a lowercase x
                     score_value = 8 if score_str == 'X' else int(score_str)
                     
                     # Validate score is within acceptable range
@@ -284,38 +375,48 @@ class WordleParser(commands.Cog):
                     
                     if not user_mentions:
                         # No mentions found, default to command author
-                        user_mentions = [str(ctx.author.id)]
+                        user_mentions = [ctx.author.id]
                         logging.info("No user mentions found, defaulting to command author")
                     
                     for user_id in user_mentions:
-                        member_id = int(user_id)
-                        user = ctx.guild.get_member(member_id)
+                        user = get_member(user_id)
                         username = user.display_name if user else f"Unknown_{user_id}"
                         
-                        if database_cog.has_duplicate_submission(user_id, ctx.guild.id, date):
+                        if user_id in existing:
                             errors.append(f"{username} already has a score for {date}")
-                            logging.info(f"Duplicate score submission detected for {username} on {date}")
+                            logging.debug("Duplicate score submission detected for %s on %s", username, date)
                             continue
                         
-                        success = database_cog.save_wordle_score(user_id, ctx.guild.id, username, score_value, date)
+                        # Insert-only, so a score recorded since the lookup above is never overwritten
+                        success = await asyncio.to_thread(database_cog.save_if_new, user_id, guild_id, username, score_value, date)
                         if success:
+                            existing.add(user_id)
                             saved_count += 1
-                            logging.info(f"Manual score added: {username} ({user_id}) = {score_value} points on {date}")
+                            logging.debug("Manual score added: %s (%s) = %d points on %s", username, user_id, score_value, date)
                         else:
                             errors.append(f"Failed to save score for {username}")
         
-    
+        logging.info("Manual scores for %s in guild %s: %d saved, %d errors", date, guild_id, saved_count, len(errors))
         if saved_count == 0 and not errors:
-            await ctx.message.add_reaction("❌")
-            await ctx.send("No valid score format found. Use formats like: 3/6, X/6, 3/6: @user, or just 3")
+            await asyncio.gather(
+                ctx.message.add_reaction("❌"),
+                ctx.send("No valid score format found. Use formats like: 3/6, X/6, 3/6: @user, or just 3")
+            )
             return
         
+        if saved_count > 0:
+            self.invalidate_leaderboard(guild_id)
+        
         if saved_count == 1:
-            await ctx.message.add_reaction("✅")
-            await ctx.send(f"Score has been properly documented.\nDate: {date}\nEntries processed: {saved_count}\nMaintaining accurate records is essential.")
+            await asyncio.gather(
+                ctx.message.add_reaction("✅"),
+                ctx.send(f"Score has been properly documented.\nDate: {date}\nEntries processed: {saved_count}\nMaintaining accurate records is essential.")
+            )
         elif saved_count > 1:
-            await ctx.message.add_reaction("✅")
-            await ctx.send(f"Multiple scores have been recorded.\nDate: {date}\nEntries processed: {saved_count}\nEfficiency noted.")
+            await asyncio.gather(
+                ctx.message.add_reaction("✅"),
+                ctx.send(f"Multiple scores have been recorded.\nDate: {date}\nEntries processed: {saved_count}\nEfficiency noted.")
+            )
 
         if errors:
             error_msg = "\n".join([f"❌ {error}" for error in errors[:5]])  # Limit to 5 errors
@@ -345,7 +446,7 @@ class WordleParser(commands.Cog):
             woguri overwrite_score 2024-10-01 3/6 @doa
             woguri replace_score 2024-10-01 "3/6: @doa @user2 4/6: @user3"
         """
-        logging.info(f"Manual score overwrite requested by {ctx.author} for date {date} with data: {score_data}")
+        logging.info("Manual score overwrite requested by %s for date %s with data: %s", ctx.author, date, score_data)
         
         valid_date = await self.validate_date(date, ctx)
         if not valid_date:
@@ -353,26 +454,32 @@ class WordleParser(commands.Cog):
         
         database_cog = self.bot.get_cog('DatabaseCog')
         if not database_cog:
-            await ctx.message.add_reaction("❌")
-            await ctx.send("Database systems are offline. Even the best strategies require functional infrastructure.")
+            await asyncio.gather(
+                ctx.message.add_reaction("❌"),
+                ctx.send("Database systems are offline. Even the best strategies require functional infrastructure.")
+            )
             logging.error("DatabaseCog not found!")
             return
         
+        guild_id = ctx.guild.id
+        get_member = ctx.guild.get_member
         saved_count = 0
         errors = []
+        pending = []  # (username, row) pairs, written together once every line is parsed
         
         # Use the same parsing logic as the automatic parser - much more reliable!
-        lines = score_data.split('\n')
+        lines = score_data.splitlines()
         for line in lines:
-            if '/6:' in line or '/6' in line:
-                # Extract score and users from each line (including X/6 for failures)
-                score_match = re.search(self.PARSE_SCORE_PATTERN, line)
+            if '/6' in line:
+                # Extract score and users from each line (including X/6 for failures);
+                # the literal '/6:' check skips the colon regex for simple "5/6 @user" input
+                score_match = self.PARSE_SCORE_PATTERN.search(line) if '/6:' in line else None
                 if not score_match:
                     # Try without colon for simple format like "5/6 @user"
-                    score_match = re.search(r'(\d|X)/6', line.upper())
+                    score_match = self.LOOSE_SCORE_PATTERN.search(line)
                 
                 if score_match:
-                    score_str = score_match.group(1)
+                    score_str = score_match.group(1).upper()  # patterns accept a lowercase x
                     score_value = 8 if score_str == 'X' else int(score_str)
                     
                     # Validate score is within acceptable range
@@ -381,38 +488,29 @@ class WordleParser(commands.Cog):
                         continue
                     
                     # Extract mentioned users (@ mentions)
-                    user_mentions = re.findall(self.PARSE_USER_PATTERN, line)
+                    user_mentions = [int(user_id) for user_id in self._scan_mentions(line)]
                     
                     if not user_mentions:
                         # No mentions found, default to command author
-                        user_mentions = [str(ctx.author.id)]
+                        user_mentions = [ctx.author.id]
                         logging.info("No user mentions found, defaulting to command author")
                     
                     for user_id in user_mentions:
-                        member_id = int(user_id)
-                        user = ctx.guild.get_member(member_id)
+                        user = get_member(user_id)
                         username = user.display_name if user else f"Unknown_{user_id}"
                         
-                        # For overwrite, delete existing entries first to prevent duplicates
-                        database_cog.delete_user_score(user_id, ctx.guild.id, date)
-                        
-                        success = database_cog.save_wordle_score(user_id, ctx.guild.id, username, score_value, date)
-                        if success:
-                            saved_count += 1
-                            logging.info(f"Manual score overwritten: {username} ({user_id}) = {score_value} points on {date}")
-                        else:
-                            errors.append(f"Failed to save score for {username}")
+                        pending.append((username, (user_id, guild_id, username, score_value, date)))
             else:
                 # Handle lines without /6 format - look for standalone scores
                 # Extract all user mentions first
-                user_mentions = re.findall(self.PARSE_USER_PATTERN, line)
+                user_mentions = [int(user_id) for user_id in self._scan_mentions(line)]
                 
                 # Look for standalone score (just a number or X)
-                clean_line = re.sub(r'<@!?\d+>', '', line).strip()
-                score_match = re.search(r'\b(\d|X)\b', clean_line.upper())
+                clean_line = self.MENTION_STRIP_PATTERN.sub('', line).strip()
+                score_match = self.STANDALONE_SCORE_PATTERN.search(clean_line)
                 
                 if score_match:
-                    score_str = score_match.group(1)
+                    score_str = score_match.group(1).upper()  # patterns accept a lowercase x
                     score_value = 8 if score_str == 'X' else int(score_str)
                     
                     # Validate score is within acceptable range
@@ -422,36 +520,46 @@ class WordleParser(commands.Cog):
                     
                     if not user_mentions:
                         # No mentions found, default to command author
-                        user_mentions = [str(ctx.author.id)]
+                        user_mentions = [ctx.author.id]
                         logging.info("No user mentions found, defaulting to command author")
                     
                     for user_id in user_mentions:
-                        member_id = int(user_id)
-                        user = ctx.guild.get_member(member_id)
+                        user = get_member(user_id)
                         username = user.display_name if user else f"Unknown_{user_id}"
                         
-                        # For overwrite, delete existing entries first to prevent duplicates
-                        database_cog.delete_user_score(user_id, ctx.guild.id, date)
-                        
-                        success = database_cog.save_wordle_score(user_id, ctx.guild.id, username, score_value, date)
-                        if success:
-                            saved_count += 1
-                            logging.info(f"Manual score overwritten: {username} ({user_id}) = {score_value} points on {date}")
-                        else:
-                            errors.append(f"Failed to save score for {username}")
+                        pending.append((username, (user_id, guild_id, username, score_value, date)))
         
+        if pending:
+            # One upsert transaction for the whole command instead of a commit per user
+            if await asyncio.to_thread(database_cog.upsert_wordle_scores, [row for _, row in pending]):
+                saved_count = len(pending)
+                for username, (user_id, _, _, score_value, _) in pending:
+                    logging.debug("Manual score overwritten: %s (%s) = %d points on %s", username, user_id, score_value, date)
+            else:
+                errors.extend(f"Failed to save score for {username}" for username, _ in pending)
+        
+        logging.info("Manual overwrite for %s in guild %s: %d saved, %d errors", date, guild_id, saved_count, len(errors))
         # If no scores were processed at all, show error
         if saved_count == 0 and not errors:
-            await ctx.message.add_reaction("❌")
-            await ctx.send("No valid score format found. Use formats like: 3/6, X/6, 3/6: @user, or just 3")
+            await asyncio.gather(
+                ctx.message.add_reaction("❌"),
+                ctx.send("No valid score format found. Use formats like: 3/6, X/6, 3/6: @user, or just 3")
+            )
             return
         
+        if saved_count > 0:
+            self.invalidate_leaderboard(guild_id)
+        
         if saved_count == 1:
-            await ctx.message.add_reaction("✅")
-            await ctx.send(f"Previous record has been corrected and updated.\nDate: {date}\nEntries modified: {saved_count}\nAccuracy is paramount.")
+            await asyncio.gather(
+                ctx.message.add_reaction("✅"),
+                ctx.send(f"Previous record has been corrected and updated.\nDate: {date}\nEntries modified: {saved_count}\nAccuracy is paramount.")
+            )
         elif saved_count > 1:
-            await ctx.message.add_reaction("✅")
-            await ctx.send(f"Multiple records have been corrected.\nDate: {date}\nEntries modified: {saved_count}\nPrecision maintained.")
+            await asyncio.gather(
+                ctx.message.add_reaction("✅"),
+                ctx.send(f"Multiple records have been corrected.\nDate: {date}\nEntries modified: {saved_count}\nPrecision maintained.")
+            )
 
         if errors:
             error_msg = "\n".join([f"❌ {error}" for error in errors[:5]])  # Limit to 5 errors
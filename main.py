@@ -4,6 +4,30 @@ import logging
 from dotenv import load_dotenv
 import os
 import asyncio
+import random
+
+# Command prefixes the bot answers to (tuple so they can't be changed at runtime)
+COMMAND_PREFIXES = ('Woguri ', 'woguri ')
+
+# Error replies, built once instead of on every failed command
+_CMDNOTFOUND_RESPONSES = (
+    "'{command}' isn’t a valid command.",
+    "I don’t recognise '{command}'.",
+    "That command doesn’t exist.",
+    "'{command}'... not found.",
+    "No command by that name.",
+    "Invalid command: '{command}'.",
+    "I don’t think that’s right.",
+    "Check your input. '{command}' isn’t one of mine."
+)
+_NOTOWNER_RESPONSES = (
+    "That command’s above your pay grade.",
+    "Only really cool people can use that command. And you're...",
+    "Oh thats not...",
+    "He pays for my food. That’s why he gets access.",
+    "You’re not cleared for that. Sorry buddy.",
+    "You could try again, but it won’t change anything."
+)
 
 def setup_logging() -> None:
     """Configure logging for the application."""
@@ -16,11 +40,14 @@ def setup_logging() -> None:
 
 def create_bot() -> commands.Bot:
     """Create and configure the Discord bot instance."""
-    intents = discord.Intents.default()
-    intents.message_content = True
-    intents.members = True
+    # Only the gateway events the cogs actually use
+    intents = discord.Intents.none()
+    intents.guilds = True           # guild cache, role/channel update events
+    intents.messages = True         # guild + DM messages for commands and reports
+    intents.message_content = True  # read Wordle reports and command text
+    intents.members = True          # member cache for role resets and name lookups
     
-    bot = commands.Bot(command_prefix=['Woguri ', 'woguri '], intents=intents)
+    bot = commands.Bot(command_prefix=COMMAND_PREFIXES, intents=intents)
     logging.info("Bot instance created")
     return bot
 
@@ -32,46 +59,18 @@ async def setup_error_handlers(bot: commands.Bot) -> None:
         """Handle command errors with Oguri Cap's calm tone."""
         
         if isinstance(error, commands.CommandNotFound):
-            # Handle both "Woguri " and "woguri " prefixes
-            message_content = ctx.message.content if ctx.message.content else ""
-            if message_content.startswith('Woguri '):
-                invalid_command = message_content.replace('Woguri ', '', 1).split()[0] if message_content else "???"
-            elif message_content.startswith('woguri '):
-                invalid_command = message_content.replace('woguri ', '', 1).split()[0] if message_content else "???"
-            else:
-                invalid_command = "???"
+            # discord.py already split off the prefix and the attempted command name
+            invalid_command = ctx.invoked_with or "???"
             
             logging.warning(f"Invalid command '{invalid_command}' used by {ctx.author} ({ctx.author.id}) in guild {ctx.guild.id if ctx.guild else 'DM'}")
             
-            responses = [
-                f"'{invalid_command}' isn’t a valid command.",
-                f"I don’t recognise '{invalid_command}'.",
-                f"That command doesn’t exist.",
-                f"'{invalid_command}'... not found.",
-                f"No command by that name.",
-                f"Invalid command: '{invalid_command}'.",
-                f"I don’t think that’s right.",
-                f"Check your input. '{invalid_command}' isn’t one of mine."
-            ]
-            
-            import random
-            response = random.choice(responses)
+            response = random.choice(_CMDNOTFOUND_RESPONSES).format(command=invalid_command)
             await ctx.send(response, delete_after=8)
             
         elif isinstance(error, commands.NotOwner):
             logging.warning(f"Non-owner {ctx.author} ({ctx.author.id}) tried to use owner command {ctx.command}")
             
-            responses = [
-            "That command’s above your pay grade.",
-            "Only really cool people can use that command. And you're...",
-            "Oh thats not..."
-            "He pays for my food. That’s why he gets access.",
-            "You’re not cleared for that. Sorry buddy.",
-            "You could try again, but it won’t change anything."
-        ]
-            
-            import random
-            response = random.choice(responses)
+            response = random.choice(_NOTOWNER_RESPONSES)
             await ctx.send(response, delete_after=8)
             
         elif isinstance(error, commands.MissingRequiredArgument):
@@ -97,12 +96,20 @@ async def load_cogs(bot: commands.Bot) -> None:
         "cogs.utility"
     ]
     
-    for cog in cogs_to_load:
+    async def load(cog: str) -> None:
         try:
             await bot.load_extension(cog)
             logging.info(f"Loaded cog: {cog}")
         except Exception as e:
             logging.error(f"Failed to load cog {cog}: {e}")
+    
+    # Cogs only look each other up at runtime via get_cog, so load order doesn't matter
+    await asyncio.gather(*(load(cog) for cog in cogs_to_load))
+
+    # One cog per module - a second class in the same file usually means a copy-paste duplicate
+    cog_modules = [loaded.__class__.__module__ for loaded in bot.cogs.values()]
+    if len(set(cog_modules)) != len(cog_modules):
+        logging.warning(f"Multiple cogs registered from the same module: {sorted(cog_modules)}")
 
 async def main() -> None:
 